@@ -4,9 +4,16 @@ from flask_cors import CORS
 from config import Config
 from models.db import db, init_db
 from routes.auth import auth_bp
-from routes.interview import interview_bp
+from routes.interview import interview_bp, voice_processor
 from routes.dashboard import dashboard_bp
 from routes.language import language_bp
+from services.ai_engine import (
+    engine_pool,
+    ideal_answer_cache,
+    ideal_answer_prefetcher,
+)
+from services.answer_jobs import answer_job_runner
+from services.upload_store import upload_store
 import os
 
 
@@ -33,6 +40,9 @@ def create_app():
     # Initialize database
     init_db(app)
 
+    # Build the per-language interview engines once per process
+    engine_pool.warm()
+
     # Register blueprints
     app.register_blueprint(auth_bp, url_prefix="/api/auth")
     app.register_blueprint(interview_bp, url_prefix="/api/interview")
@@ -67,6 +77,20 @@ def create_app():
             }
         )
 
+    # Runtime metrics endpoint
+    @app.route("/api/metrics")
+    def api_metrics():
+        return jsonify(
+            {
+                "engine_pool": engine_pool.stats(),
+                "ideal_answer_cache": ideal_answer_cache.stats(),
+                "ideal_answer_prefetch": ideal_answer_prefetcher.stats(),
+                "transcription": voice_processor.stats(),
+                "answer_jobs": answer_job_runner.stats(),
+                "upload_store": upload_store.stats(),
+            }
+        )
+
     # Serve uploaded files
     @app.route("/static/uploads/<filename>")
     def uploaded_file(filename):
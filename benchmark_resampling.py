@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark the audio resampler used before Whisper transcription
+
+Compares the old integer-step decimation with the polyphase resampler in
+services.voice_processor: output length, resampling time and, when Whisper
+is installed, transcription real-time factor (processing time / audio length).
+
+Usage:
+    python benchmark_resampling.py [audio_file ...]
+
+Without arguments a synthetic 30 second 44.1 kHz test signal is used.
+"""
+
+import os
+import sys
+import time
+import numpy as np
+import soundfile as sf
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.voice_processor import SAMPLE_RATE, resample
+
+
+def decimate(samples, samplerate):
+    """The previous approach: keep every Nth sample, no low-pass filter"""
+    step = samplerate // SAMPLE_RATE
+    return samples[::step] if step > 1 else samples
+
+
+def synthetic_signal(seconds=30, samplerate=44100):
+    """Speech-band tones plus high-frequency content that aliases when decimated"""
+    t = np.arange(seconds * samplerate) / samplerate
+    signal = 0.4 * np.sin(2 * np.pi * 220 * t) + 0.2 * np.sin(2 * np.pi * 1800 * t)
+    signal += 0.2 * np.sin(2 * np.pi * 12000 * t)
+    return signal.astype(np.float32), samplerate
+
+
+def load(path):
+    data, samplerate = sf.read(path, dtype="float32")
+    if data.ndim > 1:
+        data = data.mean(axis=1)
+    return data, samplerate
+
+
+def time_call(func, *args, repeat=3):
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def load_whisper():
+    try:
+        import whisper
+        from config import Config
+
+        return whisper.load_model(Config.WHISPER_MODEL)
+    except Exception as e:
+        print(f"⚠️ Whisper unavailable, skipping transcription RTF: {e}")
+        return None
+
+
+def benchmark(name, samples, samplerate, model):
+    duration = len(samples) / samplerate
+    expected = round(duration * SAMPLE_RATE)
+
+    print(f"\n🎧 {name}: {duration:.1f}s at {samplerate} Hz")
+    print(f"   Expected 16 kHz length: {expected} samples")
+
+    for label, func in (("decimation", decimate), ("polyphase", resample)):
+        output, elapsed = time_call(func, samples, samplerate)
+        output = np.ascontiguousarray(output, dtype=np.float32)
+        output_seconds = len(output) / SAMPLE_RATE
+
+        line = (
+            f"   {label:<11} length={len(output):>8} "
+            f"({output_seconds:6.2f}s audio) resample={elapsed * 1000:7.1f}ms"
+        )
+
+        if model is not None:
+            started = time.perf_counter()
+            result = model.transcribe(output, fp16=False)
+            rtf = (time.perf_counter() - started) / duration
+            line += f" RTF={rtf:.3f} chars={len(result['text'].strip())}"
+
+        print(line)
+
+
+def main():
+    print("🎚️ AI Interview CRM - Resampling Benchmark")
+    print("=" * 45)
+
+    model = load_whisper()
+
+    if len(sys.argv) > 1:
+        for path in sys.argv[1:]:
+            try:
+                samples, samplerate = load(path)
+            except Exception as e:
+                print(f"❌ Could not read {path}: {e}")
+                return False
+            benchmark(os.path.basename(path), samples, samplerate, model)
+    else:
+        samples, samplerate = synthetic_signal()
+        benchmark("synthetic signal", samples, samplerate, model)
+
+    print("\n✅ Benchmark complete")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
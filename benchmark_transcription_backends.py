@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Compare transcription backends on the same clips
+
+Runs every available backend (openai-whisper and faster-whisper) on each clip
+and reports load time, per-clip latency, real-time factor (processing time /
+audio length) and parity with the first backend as word error rate.
+
+Usage:
+    python benchmark_transcription_backends.py [--model base.en] [--language en] clip.wav ...
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import Config
+from services.transcription_backends import BACKENDS
+from services.voice_processor import SAMPLE_RATE, VoiceProcessor, decode_options
+
+
+def word_error_rate(reference, hypothesis):
+    """Word-level edit distance divided by the reference length"""
+    ref = reference.lower().split()
+    hyp = hypothesis.lower().split()
+    if not ref:
+        return 0.0 if not hyp else 1.0
+
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hyp, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (ref_word != hyp_word),
+                )
+            )
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def load_clips(paths):
+    """Decode every clip once, the same way the app does"""
+    clips = []
+    for path in paths:
+        samples = VoiceProcessor.load_audio(path)
+        clips.append((os.path.basename(path), samples))
+    return clips
+
+
+def benchmark_backend(name, model_name, language, clips):
+    backend = BACKENDS[name]()
+    try:
+        started = time.perf_counter()
+        model = backend.load(model_name)
+        load_time = time.perf_counter() - started
+    except Exception as e:
+        print(f"⚠️ {name}: unavailable ({e})")
+        return None
+
+    print(f"\n⚙️ {name}: model {model_name} loaded in {load_time:.1f}s")
+    options = decode_options(model_name, backend.device(model))
+
+    results = {}
+    total_audio = 0.0
+    total_time = 0.0
+    for clip_name, samples in clips:
+        duration = len(samples) / SAMPLE_RATE
+        started = time.perf_counter()
+        text = backend.transcribe(model, samples, language=language, options=options)
+        elapsed = time.perf_counter() - started
+
+        total_audio += duration
+        total_time += elapsed
+        results[clip_name] = text
+        print(
+            f"   {clip_name:<30} {duration:6.1f}s audio "
+            f"{elapsed:6.2f}s RTF={elapsed / duration:.3f}"
+        )
+
+    print(f"   Overall RTF: {total_time / total_audio:.3f}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("clips", nargs="+", help="Audio files to transcribe")
+    parser.add_argument("--model", default=Config.WHISPER_MODEL)
+    parser.add_argument("--language", default="en")
+    args = parser.parse_args()
+
+    print("🏁 AI Interview CRM - Transcription Backend Benchmark")
+    print("=" * 55)
+
+    try:
+        clips = load_clips(args.clips)
+    except Exception as e:
+        print(f"❌ Could not read clips: {e}")
+        return False
+
+    transcripts = {}
+    for name in BACKENDS:
+        results = benchmark_backend(name, args.model, args.language, clips)
+        if results is not None:
+            transcripts[name] = results
+
+    if len(transcripts) < 2:
+        print("\n⚠️ Parity needs at least two backends installed")
+        return bool(transcripts)
+
+    reference_name, reference = next(iter(transcripts.items()))
+    print(f"\n📏 Parity against {reference_name} (word error rate)")
+    for name, results in list(transcripts.items())[1:]:
+        for clip_name, _ in clips:
+            wer = word_error_rate(reference[clip_name], results[clip_name])
+            print(f"   {name:<15} {clip_name:<30} WER={wer:.3f}")
+
+    print("\n✅ Benchmark complete")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
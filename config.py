@@ -22,11 +22,67 @@ class Config:
     UPLOAD_FOLDER = os.path.join(os.path.dirname(__file__), "static", "uploads")
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max upload size
     ALLOWED_EXTENSIONS = {"pdf"}
+    # Keep uploaded resume PDFs, written in the background under a hash of
+    # their content; resumes are parsed from the upload stream either way
+    RESUME_STORE_UPLOADS = os.getenv("RESUME_STORE_UPLOADS", "True").lower() in [
+        "true",
+        "1",
+        "yes",
+    ]
+
+    # Resume PDF extraction: text beyond these budgets is never read (0 = no
+    # limit). PDFs with at least PDF_PARALLEL_MIN_PAGES pages are split across
+    # PDF_WORKERS processes by page range (0 = extract in the request thread).
+    PDF_MAX_CHARS = int(os.getenv("PDF_MAX_CHARS", 20000))
+    PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", 20))
+    PDF_WORKERS = int(os.getenv("PDF_WORKERS", 0))
+    PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", 16))
 
     # API Keys
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+    GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash-lite-preview-06-17")
     NUM_INTERVIEW_QUESTIONS = int(os.getenv("NUM_INTERVIEW_QUESTIONS", 10))
 
+    # AI call concurrency: run answer evaluation and follow-up generation in
+    # parallel on a bounded thread pool, each Gemini call bounded by a timeout
+    AI_CONCURRENT_EVALUATION = os.getenv(
+        "AI_CONCURRENT_EVALUATION", "True"
+    ).lower() in ["true", "1", "yes"]
+    AI_MAX_WORKERS = int(os.getenv("AI_MAX_WORKERS", 8))
+    AI_CALL_TIMEOUT = float(os.getenv("AI_CALL_TIMEOUT", 30))
+
+    # Answer evaluation mode: "standard" (ideal answer, feedback and follow-up as
+    # separate calls) or "fused" (one structured JSON call for all three)
+    AI_EVALUATION_MODE = os.getenv("AI_EVALUATION_MODE", "standard")
+
+    # Cache database (SQLite) shared by all worker processes
+    CACHE_DB_PATH = os.getenv(
+        "CACHE_DB_PATH", os.path.join(os.path.dirname(__file__), "instance", "cache.db")
+    )
+
+    # Ideal-answer cache: in-memory LRU in front of a persistent SQLite table
+    IDEAL_ANSWER_CACHE_ENABLED = os.getenv(
+        "IDEAL_ANSWER_CACHE_ENABLED", "True"
+    ).lower() in ["true", "1", "yes"]
+    IDEAL_ANSWER_CACHE_SIZE = int(os.getenv("IDEAL_ANSWER_CACHE_SIZE", 512))
+    IDEAL_ANSWER_CACHE_MAX_ROWS = int(os.getenv("IDEAL_ANSWER_CACHE_MAX_ROWS", 10000))
+    IDEAL_ANSWER_CACHE_TTL = int(os.getenv("IDEAL_ANSWER_CACHE_TTL", 7 * 24 * 3600))
+
+    # Generate ideal answers for all questions in the background at interview start
+    PREFETCH_IDEAL_ANSWERS = os.getenv("PREFETCH_IDEAL_ANSWERS", "True").lower() in [
+        "true",
+        "1",
+        "yes",
+    ]
+    PREFETCH_MAX_WORKERS = int(os.getenv("PREFETCH_MAX_WORKERS", 4))
+
+    # Background answer jobs (POST /api/interview/process with async=true)
+    ANSWER_JOB_WORKERS = int(os.getenv("ANSWER_JOB_WORKERS", 2))
+    ANSWER_JOB_TIMEOUT = int(os.getenv("ANSWER_JOB_TIMEOUT", 600))  # seconds
+    ANSWER_JOB_RETENTION = int(os.getenv("ANSWER_JOB_RETENTION", 86400))  # seconds
+    # Job status streams close after this long, well under the gunicorn timeout
+    ANSWER_JOB_STREAM_SECONDS = int(os.getenv("ANSWER_JOB_STREAM_SECONDS", 60))
+
     # Language configuration
     SUPPORTED_LANGUAGES = {
         "en": {
@@ -44,6 +100,101 @@ class Config:
     }
     DEFAULT_LANGUAGE = os.getenv("DEFAULT_LANGUAGE", "en")
 
+    # Voice processing configuration
+    WHISPER_MODEL = os.getenv("WHISPER_MODEL", "base")
+
+    # Speech-to-text engine: "whisper" (openai-whisper, PyTorch) or
+    # "faster-whisper" (CTranslate2, requires `pip install faster-whisper`)
+    TRANSCRIPTION_BACKEND = os.getenv("TRANSCRIPTION_BACKEND", "whisper")
+    FASTER_WHISPER_DEVICE = os.getenv("FASTER_WHISPER_DEVICE", "cpu")
+    FASTER_WHISPER_COMPUTE_TYPE = os.getenv("FASTER_WHISPER_COMPUTE_TYPE", "int8")
+
+    # CPU inference tuning. Threads default to the available cores divided by
+    # the number of web workers (gunicorn's WEB_CONCURRENCY).
+    WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", 4))
+    WHISPER_CPU_THREADS = int(os.getenv("WHISPER_CPU_THREADS", 0))  # 0 = auto
+    WHISPER_INTEROP_THREADS = int(os.getenv("WHISPER_INTEROP_THREADS", 1))
+    # Pin each worker to its own block of WHISPER_CPU_THREADS cores
+    WHISPER_CPU_AFFINITY = os.getenv("WHISPER_CPU_AFFINITY", "False").lower() in [
+        "true",
+        "1",
+        "yes",
+    ]
+    # Dynamic int8 quantization of linear layers (openai-whisper backend, CPU)
+    WHISPER_QUANTIZE = os.getenv("WHISPER_QUANTIZE", "False").lower() in [
+        "true",
+        "1",
+        "yes",
+    ]
+
+    # Model tiers, fastest first. Under load transcription steps down from
+    # WHISPER_MODEL to faster tiers, and back up when load drops.
+    WHISPER_MODEL_TIERS = [
+        tier.strip()
+        for tier in os.getenv("WHISPER_MODEL_TIERS", "tiny,base,small").split(",")
+        if tier.strip()
+    ]
+    WHISPER_ADAPTIVE_TIERS = os.getenv("WHISPER_ADAPTIVE_TIERS", "True").lower() in [
+        "true",
+        "1",
+        "yes",
+    ]
+    WHISPER_TIER_QUEUE_THRESHOLD = int(os.getenv("WHISPER_TIER_QUEUE_THRESHOLD", 2))
+    # p95 processing seconds per second of audio (clips count as >= 30 s)
+    WHISPER_TIER_RTF_THRESHOLD = float(os.getenv("WHISPER_TIER_RTF_THRESHOLD", 0.5))
+    WHISPER_TIER_COOLDOWN = float(os.getenv("WHISPER_TIER_COOLDOWN", 30))  # seconds
+
+    # Admission control per process: clips transcribed at once, clips allowed
+    # to wait for a slot, and how long they wait before a 503 with Retry-After
+    WHISPER_MAX_CONCURRENT = int(os.getenv("WHISPER_MAX_CONCURRENT", 1))
+    WHISPER_MAX_QUEUED = int(os.getenv("WHISPER_MAX_QUEUED", 4))
+    WHISPER_QUEUE_TIMEOUT = float(os.getenv("WHISPER_QUEUE_TIMEOUT", 30))  # seconds
+
+    # Whisper model per interview language, as "lang=template" pairs where
+    # {tier} is the current model tier. English-only ".en" models are faster
+    # and more accurate for English at the same size; languages not listed
+    # use the multilingual model.
+    WHISPER_MODEL_BY_LANGUAGE = dict(
+        pair.strip().split("=", 1)
+        for pair in os.getenv("WHISPER_MODEL_BY_LANGUAGE", "en={tier}.en").split(",")
+        if "=" in pair
+    )
+
+    # Transcripts of identical audio uploads (client retries)
+    TRANSCRIPT_CACHE_ENABLED = os.getenv(
+        "TRANSCRIPT_CACHE_ENABLED", "True"
+    ).lower() in ["true", "1", "yes"]
+    TRANSCRIPT_CACHE_PERSIST = os.getenv(
+        "TRANSCRIPT_CACHE_PERSIST", "True"
+    ).lower() in ["true", "1", "yes"]
+    TRANSCRIPT_CACHE_SIZE = int(os.getenv("TRANSCRIPT_CACHE_SIZE", 256))
+    TRANSCRIPT_CACHE_MAX_ROWS = int(os.getenv("TRANSCRIPT_CACHE_MAX_ROWS", 5000))
+    TRANSCRIPT_CACHE_TTL = int(os.getenv("TRANSCRIPT_CACHE_TTL", 24 * 3600))
+
+    # ffmpeg decodes WebM/Opus and MP4 browser recordings
+    FFMPEG_PATH = os.getenv("FFMPEG_PATH", "ffmpeg")
+    FFMPEG_TIMEOUT = float(os.getenv("FFMPEG_TIMEOUT", 60))  # seconds
+
+    # Longest recorded answer accepted (0 = no limit)
+    MAX_ANSWER_SECONDS = float(os.getenv("MAX_ANSWER_SECONDS", 300))
+
+    # Silence trimming before transcription (energy / zero-crossing VAD)
+    VAD_ENABLED = os.getenv("VAD_ENABLED", "True").lower() in ["true", "1", "yes"]
+    VAD_MAX_PAUSE = float(os.getenv("VAD_MAX_PAUSE", 0.6))  # seconds kept per pause
+    VAD_PADDING = float(os.getenv("VAD_PADDING", 0.2))  # seconds kept around speech
+
+    # Optional shared transcription server: one process owns the Whisper model
+    # and every web worker sends it requests over this Unix socket
+    TRANSCRIPTION_SERVER_SOCKET = os.getenv("TRANSCRIPTION_SERVER_SOCKET")
+    TRANSCRIPTION_SERVER_AUTHKEY = os.getenv(
+        "TRANSCRIPTION_SERVER_AUTHKEY", SECRET_KEY
+    ).encode("utf-8")
+    TRANSCRIPTION_SERVER_TIMEOUT = float(os.getenv("TRANSCRIPTION_SERVER_TIMEOUT", 110))
+    # Clips queued on the server beyond this are turned away as busy
+    TRANSCRIPTION_SERVER_MAX_QUEUED = int(
+        os.getenv("TRANSCRIPTION_SERVER_MAX_QUEUED", 16)
+    )
+
     # Application settings
     DEBUG = os.getenv("FLASK_DEBUG", "False").lower() in ["true", "1", "yes"]
     TESTING = os.getenv("FLASK_TESTING", "False").lower() in ["true", "1", "yes"]
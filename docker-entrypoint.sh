@@ -38,6 +38,18 @@ except Exception as e:
     sys.exit(1)
 "
 
+# 🎤 Start the shared transcription server if configured
+if [ -n "$TRANSCRIPTION_SERVER_SOCKET" ]; then
+    echo "🎤 Starting shared transcription server on $TRANSCRIPTION_SERVER_SOCKET..."
+    python -m services.transcription_server &
+
+    # Wait for the model to load and the socket to appear
+    for i in $(seq 1 120); do
+        [ -S "$TRANSCRIPTION_SERVER_SOCKET" ] && break
+        sleep 1
+    done
+fi
+
 echo "🚀 Starting application with command: $@"
 
 # 🎯 Execute the main command
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Database migration script to add the resume content hash column
+Run this script to enable parse reuse for identical resume uploads
+"""
+
+import sqlite3
+import os
+
+
+def migrate_database():
+    """Add content_hash column and index to the resumes table"""
+    # Check multiple possible database locations
+    possible_paths = [
+        "interview.db",
+        "instance/interview.db",
+    ]
+
+    db_path = None
+    for path in possible_paths:
+        if os.path.exists(path):
+            db_path = path
+            break
+
+    if not db_path:
+        print("Database file not found in any of the expected locations:")
+        for path in possible_paths:
+            print(f"  - {path}")
+        print("A new database will be created with the column on first start.")
+        return
+
+    print(f"Found database at: {db_path}")
+
+    conn = None
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+
+        cursor.execute("PRAGMA table_info(resumes)")
+        resume_columns = [column[1] for column in cursor.fetchall()]
+
+        if "content_hash" not in resume_columns:
+            print("Adding content_hash column to resumes table...")
+            cursor.execute("ALTER TABLE resumes ADD COLUMN content_hash VARCHAR(64)")
+            print("✓ Added content_hash column to resumes table")
+        else:
+            print("✓ content_hash column already exists in resumes table")
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS ix_resumes_content_hash
+            ON resumes (content_hash)
+        """)
+        print("✓ Index ix_resumes_content_hash is present")
+
+        conn.commit()
+        print("✅ Database migration completed successfully!")
+
+    except sqlite3.Error as e:
+        print(f"❌ Database error: {e}")
+        if conn:
+            conn.rollback()
+    finally:
+        if conn:
+            conn.close()
+
+
+if __name__ == "__main__":
+    print("🚀 AI Interview CRM - Resume Content Hash Migration")
+    print("=" * 50)
+    migrate_database()
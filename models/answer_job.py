@@ -0,0 +1,65 @@
+# Background answer processing job model
+from models.db import db
+from datetime import datetime, timedelta
+import uuid
+
+
+class AnswerJob(db.Model):
+    __tablename__ = "answer_jobs"
+
+    QUEUED = "queued"
+    TRANSCRIBING = "transcribing"
+    EVALUATING = "evaluating"
+    DONE = "done"
+    FAILED = "failed"
+    FINISHED = (DONE, FAILED)
+
+    id = db.Column(db.String(32), primary_key=True, default=lambda: uuid.uuid4().hex)
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
+    interview_id = db.Column(db.Integer, db.ForeignKey("interviews.id"), nullable=False)
+    status = db.Column(db.String(16), default=QUEUED, nullable=False)
+    result = db.Column(db.JSON)  # Same payload /process returns
+    error = db.Column(db.String(255))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    @property
+    def finished(self):
+        return self.status in self.FINISHED
+
+    def set_status(self, status, result=None, error=None):
+        self.status = status
+        self.result = result
+        self.error = error
+        self.updated_at = datetime.utcnow()
+        db.session.commit()
+
+    def fail_if_stale(self, timeout):
+        """Mark a job failed if no worker has updated it within timeout seconds
+
+        Jobs are lost if the process running them restarts.
+        """
+        if not self.finished and self.updated_at < datetime.utcnow() - timedelta(
+            seconds=timeout
+        ):
+            self.set_status(self.FAILED, error="Answer processing timed out")
+
+    @classmethod
+    def purge_finished(cls, older_than):
+        """Delete finished jobs last updated more than older_than seconds ago"""
+        cutoff = datetime.utcnow() - timedelta(seconds=older_than)
+        cls.query.filter(cls.status.in_(cls.FINISHED), cls.updated_at < cutoff).delete(
+            synchronize_session=False
+        )
+        db.session.commit()
+
+    def to_dict(self):
+        return {
+            "job_id": self.id,
+            "interview_id": self.interview_id,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
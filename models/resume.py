@@ -1,6 +1,7 @@
 # Resume model
 from models.db import db
 from datetime import datetime
+import hashlib
 
 
 class Resume(db.Model):
@@ -11,8 +12,25 @@ class Resume(db.Model):
     text_content = db.Column(db.Text)
     file_path = db.Column(db.String(255))
     parsed_data = db.Column(db.JSON)  # Store structured resume data
+    content_hash = db.Column(db.String(64), index=True)  # SHA-256 of normalized text
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    @staticmethod
+    def hash_content(text_content):
+        """SHA-256 of the resume text with whitespace normalized"""
+        normalized = " ".join(text_content.split())
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def find_parsed(cls, content_hash):
+        """Most recent successfully parsed resume with the same content hash"""
+        return (
+            cls.query.filter_by(content_hash=content_hash)
+            .filter(cls.parsed_data.isnot(None))
+            .order_by(cls.created_at.desc())
+            .first()
+        )
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -1,15 +1,35 @@
-from flask import Blueprint, request, jsonify, current_app
-from werkzeug.utils import secure_filename
+from flask import (
+    Blueprint,
+    Response,
+    request,
+    jsonify,
+    current_app,
+    stream_with_context,
+)
 from models.resume import Resume
 from models.interview import Interview
+from models.answer_job import AnswerJob
 from models.db import db
-from services.ai_engine import InterviewEngine
-from services.voice_processor import VoiceProcessor
+from services.ai_engine import (
+    engine_pool,
+    empty_resume_data,
+    ideal_answer_prefetcher,
+)
+from services.answer_jobs import AnswerJobError, answer_job_runner
+from services.voice_processor import (
+    NO_SPEECH,
+    TOO_LONG,
+    TranscriptionBusy,
+    VoiceProcessor,
+)
 from services.analytics import ReportGenerator
 from services.pdf_parser import PDFParser
+from services.upload_store import upload_store
 from routes.auth import token_required
 import uuid
 import os
+import json
+import time
 from datetime import datetime
 from config import Config
 
@@ -20,7 +40,36 @@ voice_processor = VoiceProcessor()
 report_gen = ReportGenerator()
 pdf_parser = PDFParser()
 
-# We'll create language-specific engines as needed
+# Language-specific engines are shared through services.ai_engine.engine_pool
+
+# How often the job status stream checks for updates (seconds)
+JOB_POLL_INTERVAL = 0.5
+
+# How soon a client should reconnect to a job stream closed at its time limit
+JOB_STREAM_RETRY_MS = 1000
+
+# Longest pause between a background job's transcription retries (seconds)
+JOB_RETRY_MAX_DELAY = 30
+
+# Shown when admission control turns a transcription away
+TRANSCRIPTION_BUSY_MESSAGE = "Transcription is busy. Please try again in a moment."
+
+
+def _answer_too_long_message():
+    return f"Answer is too long. Please keep recordings under {Config.MAX_ANSWER_SECONDS:.0f} seconds."
+
+
+def _answer_too_long_response():
+    return jsonify({"error": _answer_too_long_message()}), 413
+
+
+def _transcription_busy_response(busy):
+    """503 telling the client when to retry a rejected transcription"""
+    return (
+        jsonify({"error": TRANSCRIPTION_BUSY_MESSAGE, "retry_after": busy.retry_after}),
+        503,
+        {"Retry-After": str(busy.retry_after)},
+    )
 
 
 @interview_bp.route("/resume", methods=["POST"])
@@ -40,23 +89,17 @@ def upload_resume(current_user):
             if not file.filename.lower().endswith(".pdf"):
                 return jsonify({"error": "Only PDF files are supported"}), 400
 
-            # Secure filename and save
-            original_filename = secure_filename(file.filename)
-            filename = (
-                f"resume_{current_user.id}_{uuid.uuid4().hex}_{original_filename}"
-            )
-            filepath = os.path.join(Config.UPLOAD_FOLDER, filename)
-
-            # Ensure upload directory exists
-            os.makedirs(Config.UPLOAD_FOLDER, exist_ok=True)
-            file.save(filepath)
-
-            # Extract text from PDF
-            text_content = pdf_parser.extract_text_from_pdf(filepath)
+            # Extract text straight from the upload stream, without saving first
+            text_content = pdf_parser.extract_text_from_file_object(file.stream)
 
             if not text_content or text_content.startswith("Error"):
                 return jsonify({"error": "Could not extract text from PDF file"}), 400
 
+            # Keep the original in the background, named by its content
+            if Config.RESUME_STORE_UPLOADS:
+                file.stream.seek(0)
+                filepath = upload_store.save(file.stream.read(), "resume", ".pdf")
+
         elif request.json and "text" in request.json:
             # Handle text input
             text_content = request.json["text"].strip()
@@ -72,11 +115,21 @@ def upload_resume(current_user):
                 400,
             )
 
+        # Reuse the parse of an identical resume if one exists
+        content_hash = Resume.hash_content(text_content)
+        cached_resume = Resume.find_parsed(content_hash)
+        parse_cached = cached_resume is not None
+
         # Parse resume with AI (use user's preferred language or default)
         try:
-            user_language = current_user.preferred_language or Config.DEFAULT_LANGUAGE
-            engine = InterviewEngine(language=user_language)
-            parsed_data = engine.parse_resume(text_content)
+            if parse_cached:
+                parsed_data = cached_resume.parsed_data
+            else:
+                user_language = (
+                    current_user.preferred_language or Config.DEFAULT_LANGUAGE
+                )
+                engine = engine_pool.get(user_language)
+                parsed_data = engine.parse_resume(text_content)
         except Exception as e:
             print(f"Resume parsing error: {e}")
             return (
@@ -94,6 +147,8 @@ def upload_resume(current_user):
             text_content=text_content,
             file_path=filepath,
             parsed_data=parsed_data,
+            # Failed parses are not reused
+            content_hash=(content_hash if parsed_data != empty_resume_data() else None),
         )
 
         db.session.add(resume)
@@ -104,6 +159,7 @@ def upload_resume(current_user):
                 "message": "Resume processed successfully",
                 "resume_id": resume.id,
                 "parsed_data": parsed_data,
+                "parse_cached": parse_cached,
                 "skills_found": len(parsed_data.get("skills", [])),
                 "experience_count": len(parsed_data.get("experience", [])),
             }
@@ -146,8 +202,8 @@ def start_interview(current_user):
         if language not in Config.SUPPORTED_LANGUAGES:
             language = Config.DEFAULT_LANGUAGE
 
-        # Create language-specific engine
-        engine = InterviewEngine(language=language)
+        # Get the shared language-specific engine
+        engine = engine_pool.get(language)
 
         # Generate questions based on resume
         try:
@@ -175,6 +231,10 @@ def start_interview(current_user):
         db.session.add(interview)
         db.session.commit()
 
+        # Generate ideal answers in the background while the candidate answers
+        if Config.PREFETCH_IDEAL_ANSWERS:
+            ideal_answer_prefetcher.prefetch(interview.id, questions, engine)
+
         return jsonify(
             {
                 "interview_id": interview.id,
@@ -189,10 +249,283 @@ def start_interview(current_user):
         return jsonify({"error": "Failed to start interview. Please try again."}), 500
 
 
+def _get_answer_text(interview, text_answer, audio_file):
+    """Get the answer text from an uploaded audio file or the text field
+
+    Returns:
+        tuple: (answer text, Whisper model used or None, None)
+            or (None, None, error response)
+    """
+    answer_text = ""
+    # Answers transcribed live by /transcribe/chunk arrive as text, tagged
+    # with the model(s) that served their segments
+    transcription_model = request.form.get("transcription_model") or None
+
+    if audio_file and audio_file.filename:
+        # Reject long clips from the file header before any decode or model work
+        if voice_processor.exceeds_max_duration(audio_file.stream):
+            return None, None, _answer_too_long_response()
+
+        # Transcribe audio straight from the upload stream using interview language
+        try:
+            # Get the language from the interview record
+            interview_language = interview.language or Config.DEFAULT_LANGUAGE
+            transcription = voice_processor.transcribe(
+                audio_file.stream, language=interview_language
+            )
+            answer_text = transcription["text"]
+            transcription_model = transcription["model"]
+            failure = transcription.get("failure")
+            # Compressed recordings are only measured once decoded
+            if failure == TOO_LONG:
+                return None, None, _answer_too_long_response()
+            if failure or not answer_text:
+                return (
+                    None,
+                    None,
+                    (
+                        jsonify(
+                            {
+                                "error": "Could not transcribe audio. Please try again or use text input."
+                            }
+                        ),
+                        400,
+                    ),
+                )
+        except TranscriptionBusy as e:
+            return None, None, _transcription_busy_response(e)
+        except Exception as e:
+            print(f"Audio processing error: {e}")
+            return (
+                None,
+                None,
+                (
+                    jsonify(
+                        {"error": "Failed to process audio. Please try text input."}
+                    ),
+                    500,
+                ),
+            )
+
+    elif text_answer:
+        answer_text = text_answer.strip()
+    else:
+        return (
+            None,
+            None,
+            (
+                jsonify({"error": "Either audio file or text answer is required"}),
+                400,
+            ),
+        )
+
+    if not answer_text:
+        return None, None, (jsonify({"error": "No answer content received"}), 400)
+
+    return answer_text, transcription_model, None
+
+
+def _record_answer(
+    interview, question, answer_text, evaluation, transcription_model=None
+):
+    """Append an evaluated answer to the interview transcript and evaluation"""
+    current_transcript = interview.transcript or ""
+    new_transcript = f"{current_transcript}\n\nQ: {question}\nA: {answer_text}"
+
+    # Copy so SQLAlchemy sees a changed JSON value
+    current_evaluations = dict(interview.evaluation or {})
+    current_evaluations["answers"] = list(current_evaluations.get("answers", []))
+
+    current_evaluations["answers"].append(
+        {
+            "question": question,
+            "answer": answer_text,
+            "evaluation": evaluation,
+            "transcription_model": transcription_model,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+    )
+
+    interview.transcript = new_transcript
+    interview.evaluation = current_evaluations
+    db.session.commit()
+
+
+def _answer_response(answer_text, evaluation, follow_up, transcription_model=None):
+    return {
+        "message": "Answer processed successfully",
+        "transcript": answer_text,
+        "transcription_model": transcription_model,
+        "evaluation": evaluation,
+        "next_question": follow_up,
+        "score": evaluation.get("score", 0),
+    }
+
+
+def _sse(event, data):
+    """Format a Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def _wants_async():
+    """Whether the client asked for a 202 job instead of a blocking response"""
+    return request.form.get("async", "").lower() in [
+        "true",
+        "1",
+        "yes",
+    ] or "respond-async" in request.headers.get("Prefer", "")
+
+
+def _submit_answer_job(current_user, interview, question, text_answer, audio_file):
+    """Queue an answer for background processing and return 202 Accepted"""
+    audio_bytes = None
+    if audio_file and audio_file.filename:
+        # The request stream is gone once we respond, so keep the upload in memory
+        audio_bytes = audio_file.read()
+        if not audio_bytes:
+            return jsonify({"error": "No answer content received"}), 400
+        if voice_processor.exceeds_max_duration(audio_bytes):
+            return _answer_too_long_response()
+    elif not (text_answer and text_answer.strip()):
+        return jsonify({"error": "Either audio file or text answer is required"}), 400
+
+    try:
+        AnswerJob.purge_finished(Config.ANSWER_JOB_RETENTION)
+    except Exception as e:
+        print(f"Answer job cleanup error: {e}")
+        db.session.rollback()
+
+    job = AnswerJob(user_id=current_user.id, interview_id=interview.id)
+    db.session.add(job)
+    db.session.commit()
+
+    answer_job_runner.submit(
+        current_app._get_current_object(),
+        job.id,
+        _process_answer_job,
+        interview.id,
+        question,
+        text_answer,
+        audio_bytes,
+        request.form.get("transcription_model") or None,
+    )
+
+    status_url = f"/api/interview/jobs/{job.id}"
+    return (
+        jsonify({"job_id": job.id, "status": job.status, "status_url": status_url}),
+        202,
+        {"Location": status_url},
+    )
+
+
+def _transcribe_when_free(audio_bytes, language):
+    """Transcribe for a background job, waiting out admission control
+
+    Jobs exist so slow transcription does not hold a web worker, so instead of
+    failing when transcription is busy they retry with exponential backoff.
+    They give up after half of ANSWER_JOB_TIMEOUT, leaving time to evaluate
+    the answer before the job is considered stale.
+    """
+    deadline = time.monotonic() + Config.ANSWER_JOB_TIMEOUT / 2
+    delay = 0
+    while True:
+        try:
+            return voice_processor.transcribe(audio_bytes, language=language)
+        except TranscriptionBusy as e:
+            delay = min(max(e.retry_after, delay * 2), JOB_RETRY_MAX_DELAY)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise AnswerJobError(TRANSCRIPTION_BUSY_MESSAGE)
+            time.sleep(min(delay, remaining))
+
+
+def _process_answer_job(
+    job, interview_id, question, text_answer, audio_bytes, transcription_model=None
+):
+    """Transcribe, evaluate and record an answer on a background thread"""
+    interview = Interview.query.get(interview_id)
+    interview_language = interview.language or Config.DEFAULT_LANGUAGE
+
+    if audio_bytes:
+        job.set_status(AnswerJob.TRANSCRIBING)
+        transcription = _transcribe_when_free(audio_bytes, interview_language)
+        answer_text = transcription["text"]
+        transcription_model = transcription["model"]
+        failure = transcription.get("failure")
+        if failure == TOO_LONG:
+            raise AnswerJobError(_answer_too_long_message())
+        if failure or not answer_text:
+            raise AnswerJobError(
+                "Could not transcribe audio. Please try again or use text input."
+            )
+    else:
+        answer_text = text_answer.strip()
+
+    job.set_status(AnswerJob.EVALUATING)
+    engine = engine_pool.get(interview_language)
+    ideal_answer = ideal_answer_prefetcher.get(interview.id, question, engine)
+    evaluation, follow_up = engine.evaluate_with_follow_up(
+        question, answer_text, ideal_answer
+    )
+
+    _record_answer(interview, question, answer_text, evaluation, transcription_model)
+    return _answer_response(answer_text, evaluation, follow_up, transcription_model)
+
+
+@interview_bp.route("/transcribe/chunk", methods=["POST"])
+@token_required
+def transcribe_chunk(current_user):
+    """Transcribe one segment of an answer while the candidate is still speaking
+
+    The recorder uploads each few-second segment as a standalone audio file,
+    so any worker can handle any segment. The client sends the transcript so
+    far as "prompt" to keep wording consistent across segment boundaries, and
+    stitches the returned texts together when recording stops.
+    """
+    try:
+        interview_id = request.form.get("interview_id")
+        audio_file = request.files.get("audio")
+        # Whisper only uses the last ~224 tokens of the prompt
+        prompt = (request.form.get("prompt") or "")[-500:]
+
+        if not interview_id or not audio_file:
+            return jsonify({"error": "interview_id and audio are required"}), 400
+
+        interview = Interview.query.get(interview_id)
+        if not interview or interview.user_id != current_user.id:
+            return jsonify({"error": "Interview not found or access denied"}), 404
+
+        transcription = voice_processor.transcribe(
+            audio_file.stream,
+            language=interview.language or Config.DEFAULT_LANGUAGE,
+            prompt=prompt or None,
+        )
+        failure = transcription.get("failure")
+
+        # A silent segment is normal mid-answer
+        if failure == NO_SPEECH:
+            return jsonify({"text": "", "model": transcription["model"]})
+
+        if failure or not transcription["text"]:
+            return jsonify({"error": "Could not transcribe audio segment"}), 400
+
+        return jsonify(transcription)
+
+    except TranscriptionBusy as e:
+        return _transcription_busy_response(e)
+    except Exception as e:
+        print(f"Chunk transcription error: {e}")
+        return jsonify({"error": "Failed to transcribe audio segment"}), 500
+
+
 @interview_bp.route("/process", methods=["POST"])
 @token_required
 def process_answer(current_user):
-    """Process an interview answer (audio or text)"""
+    """Process an interview answer (audio or text)
+
+    Send async=true (or a "Prefer: respond-async" header) to get 202 Accepted
+    with a job id instead of waiting; poll /jobs/<job_id> for the result.
+    """
     try:
         # Get form data
         interview_id = request.form.get("interview_id")
@@ -208,70 +541,26 @@ def process_answer(current_user):
         if not interview or interview.user_id != current_user.id:
             return jsonify({"error": "Interview not found or access denied"}), 404
 
-        # Process answer based on input type
-        answer_text = ""
-
-        if audio_file and audio_file.filename:
-            # Process audio file
-            filename = f"answer_{interview_id}_{uuid.uuid4().hex}.wav"
-            filepath = os.path.join(Config.UPLOAD_FOLDER, filename)
-
-            # Ensure upload directory exists
-            os.makedirs(Config.UPLOAD_FOLDER, exist_ok=True)
-            audio_file.save(filepath)
-
-            # Transcribe audio using interview language
-            try:
-                # Get the language from the interview record
-                interview_language = interview.language or Config.DEFAULT_LANGUAGE
-                answer_text = voice_processor.speech_to_text(
-                    filepath, language=interview_language
-                )
-                if (
-                    not answer_text
-                    or answer_text.startswith("Error")
-                    or answer_text.startswith("Audio")
-                ):
-                    return (
-                        jsonify(
-                            {
-                                "error": "Could not transcribe audio. Please try again or use text input."
-                            }
-                        ),
-                        400,
-                    )
-            except Exception as e:
-                print(f"Audio processing error: {e}")
-                return (
-                    jsonify(
-                        {"error": "Failed to process audio. Please try text input."}
-                    ),
-                    500,
-                )
-            finally:
-                # Clean up audio file
-                if os.path.exists(filepath):
-                    try:
-                        os.remove(filepath)
-                    except:
-                        pass
-
-        elif text_answer:
-            answer_text = text_answer.strip()
-        else:
-            return (
-                jsonify({"error": "Either audio file or text answer is required"}),
-                400,
+        if _wants_async():
+            return _submit_answer_job(
+                current_user, interview, question, text_answer, audio_file
             )
 
-        if not answer_text:
-            return jsonify({"error": "No answer content received"}), 400
+        # Process answer based on input type
+        answer_text, transcription_model, error_response = _get_answer_text(
+            interview, text_answer, audio_file
+        )
+        if error_response:
+            return error_response
 
-        # Evaluate answer using interview language
+        # Evaluate answer and generate the follow-up using interview language
         try:
             interview_language = interview.language or Config.DEFAULT_LANGUAGE
-            engine = InterviewEngine(language=interview_language)
-            evaluation = engine.evaluate_answer(question, answer_text)
+            engine = engine_pool.get(interview_language)
+            ideal_answer = ideal_answer_prefetcher.get(interview.id, question, engine)
+            evaluation, follow_up = engine.evaluate_with_follow_up(
+                question, answer_text, ideal_answer
+            )
         except Exception as e:
             print(f"Answer evaluation error: {e}")
             return (
@@ -280,48 +569,170 @@ def process_answer(current_user):
             )
 
         # Update interview transcript and evaluation
-        current_transcript = interview.transcript or ""
-        new_transcript = f"{current_transcript}\n\nQ: {question}\nA: {answer_text}"
-
-        # Store current evaluation in interview record
-        current_evaluations = interview.evaluation or {}
-        if "answers" not in current_evaluations:
-            current_evaluations["answers"] = []
+        _record_answer(
+            interview, question, answer_text, evaluation, transcription_model
+        )
 
-        current_evaluations["answers"].append(
-            {
-                "question": question,
-                "answer": answer_text,
-                "evaluation": evaluation,
-                "timestamp": datetime.utcnow().isoformat(),
-            }
+        return jsonify(
+            _answer_response(answer_text, evaluation, follow_up, transcription_model)
         )
 
-        interview.transcript = new_transcript
-        interview.evaluation = current_evaluations
-        db.session.commit()
+    except Exception as e:
+        print(f"Process answer error: {e}")
+        return jsonify({"error": "Failed to process answer. Please try again."}), 500
 
-        # Generate follow-up question (engine already created above)
-        try:
-            follow_up = engine.generate_follow_up(question, answer_text)
-        except Exception as e:
-            print(f"Follow-up generation error: {e}")
-            follow_up = "Thank you for your answer. Let's move to the next question."
 
-        return jsonify(
-            {
-                "message": "Answer processed successfully",
-                "transcript": answer_text,
-                "evaluation": evaluation,
-                "next_question": follow_up,
-                "score": evaluation.get("score", 0),
-            }
+@interview_bp.route("/process/stream", methods=["POST"])
+@token_required
+def process_answer_stream(current_user):
+    """Process an interview answer, streaming feedback as Server-Sent Events
+
+    Takes the same form fields as /process. Events, in order:
+    - transcript: {"transcript"} once the answer text is known
+    - feedback: {"text"} feedback text deltas as Gemini generates them
+    - evaluation: the same payload /process returns, after the answer is saved
+    - error: {"error"} if evaluation fails after the stream has started
+    """
+    try:
+        interview_id = request.form.get("interview_id")
+        question = request.form.get("question")
+        text_answer = request.form.get("text_answer")
+        audio_file = request.files.get("audio")
+
+        if not interview_id or not question:
+            return jsonify({"error": "interview_id and question are required"}), 400
+
+        interview = Interview.query.get(interview_id)
+        if not interview or interview.user_id != current_user.id:
+            return jsonify({"error": "Interview not found or access denied"}), 404
+
+        answer_text, transcription_model, error_response = _get_answer_text(
+            interview, text_answer, audio_file
         )
+        if error_response:
+            return error_response
+
+        interview_language = interview.language or Config.DEFAULT_LANGUAGE
+        engine = engine_pool.get(interview_language)
+        ideal_answer = ideal_answer_prefetcher.get(interview.id, question, engine)
 
     except Exception as e:
         print(f"Process answer error: {e}")
         return jsonify({"error": "Failed to process answer. Please try again."}), 500
 
+    events = engine.stream_evaluation(question, answer_text, ideal_answer)
+
+    def generate():
+        recorded = False
+        try:
+            yield _sse("transcript", {"transcript": answer_text})
+
+            for event, data in events:
+                if event == "feedback":
+                    yield _sse("feedback", {"text": data})
+                else:
+                    evaluation, follow_up = data
+
+            _record_answer(
+                interview, question, answer_text, evaluation, transcription_model
+            )
+            recorded = True
+            yield _sse(
+                "evaluation",
+                _answer_response(
+                    answer_text, evaluation, follow_up, transcription_model
+                ),
+            )
+        except GeneratorExit:
+            # The client went away; save the answer anyway, as /process does
+            if not recorded:
+                _record_answer(
+                    interview,
+                    question,
+                    answer_text,
+                    _finish_evaluation(events, engine, answer_text),
+                    transcription_model,
+                )
+            raise
+        except Exception as e:
+            print(f"Streaming answer evaluation error: {e}")
+            yield _sse(
+                "error", {"error": "Failed to evaluate answer. Please try again."}
+            )
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _finish_evaluation(events, engine, answer_text):
+    """Run the rest of an evaluation stream and return its evaluation"""
+    try:
+        for event, data in events:
+            if event == "result":
+                return data[0]
+    except Exception as e:
+        print(f"Streaming answer evaluation error: {e}")
+    return engine._fallback_evaluation(answer_text)
+
+
+@interview_bp.route("/jobs/<job_id>", methods=["GET"])
+@token_required
+def get_answer_job(current_user, job_id):
+    """Status of a background answer job
+
+    Returns the job as JSON. With ?stream=true or "Accept: text/event-stream"
+    it streams Server-Sent Events instead: status on each change, then
+    evaluation (the /process payload) or error. A stream still open after
+    Config.ANSWER_JOB_STREAM_SECONDS ends with a retry hint so that it never
+    holds a web worker up to the gunicorn timeout; EventSource reconnects
+    and picks up the current status.
+    """
+    try:
+        job = AnswerJob.query.get(job_id)
+        if not job or job.user_id != current_user.id:
+            return jsonify({"error": "Job not found or access denied"}), 404
+
+        job.fail_if_stale(Config.ANSWER_JOB_TIMEOUT)
+
+        stream = request.args.get("stream", "").lower() in ["true", "1", "yes"]
+        if not stream and "text/event-stream" not in request.headers.get("Accept", ""):
+            return jsonify(job.to_dict())
+
+    except Exception as e:
+        print(f"Get answer job error: {e}")
+        return jsonify({"error": "Failed to retrieve job status"}), 500
+
+    def generate():
+        status = None
+        deadline = time.monotonic() + Config.ANSWER_JOB_STREAM_SECONDS
+        while True:
+            if job.status != status:
+                status = job.status
+                yield _sse("status", {"status": status})
+
+            if job.status == AnswerJob.DONE:
+                yield _sse("evaluation", job.result)
+                return
+            if job.status == AnswerJob.FAILED:
+                yield _sse("error", {"error": job.error})
+                return
+            if time.monotonic() >= deadline:
+                yield f"retry: {JOB_STREAM_RETRY_MS}\n\n"
+                return
+
+            time.sleep(JOB_POLL_INTERVAL)
+            db.session.refresh(job)
+            job.fail_if_stale(Config.ANSWER_JOB_TIMEOUT)
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 
 @interview_bp.route("/complete/<int:interview_id>", methods=["POST"])
 @token_required
@@ -337,6 +748,7 @@ def complete_interview(current_user, interview_id):
 
         # Set end time
         interview.end_time = datetime.utcnow()
+        ideal_answer_prefetcher.discard(interview_id)
 
         # Get all answer evaluations
         evaluations = (
@@ -349,7 +761,7 @@ def complete_interview(current_user, interview_id):
         # Generate overall evaluation using interview language
         try:
             interview_language = interview.language or Config.DEFAULT_LANGUAGE
-            engine = InterviewEngine(language=interview_language)
+            engine = engine_pool.get(interview_language)
             overall_eval = engine.generate_overall_evaluation(
                 interview.transcript, evaluations
             )
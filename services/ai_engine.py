@@ -1,23 +1,120 @@
 import google.generativeai as genai
+from google.generativeai import client as genai_client
+from sklearn.base import clone
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 from config import Config
+from services.cache import LRUCache, SQLiteCache
+import hashlib
 import json
 import re
 import numpy as np
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
 # Configure Gemini API
 genai.configure(api_key=Config.GEMINI_API_KEY)
 
+# Bounded pool used to fan out independent Gemini calls
+_ai_executor = ThreadPoolExecutor(
+    max_workers=Config.AI_MAX_WORKERS, thread_name_prefix="gemini"
+)
+
+# Separate pool for background prefetching so it never starves the fan-out
+_prefetch_executor = ThreadPoolExecutor(
+    max_workers=Config.PREFETCH_MAX_WORKERS, thread_name_prefix="prefetch"
+)
+
+DEFAULT_FOLLOW_UP = "Can you provide a specific example to illustrate your point?"
+
+# JSON schema for the single-call ("fused") answer evaluation
+FUSED_EVALUATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "ideal_answer": {"type": "string"},
+        "score": {"type": "number", "minimum": 0, "maximum": 100},
+        "feedback": {"type": "string"},
+        "strengths": {"type": "array", "items": {"type": "string"}},
+        "improvements": {"type": "array", "items": {"type": "string"}},
+        "suggestions": {"type": "array", "items": {"type": "string"}},
+        "follow_up": {"type": "string"},
+    },
+    "required": [
+        "ideal_answer",
+        "score",
+        "feedback",
+        "strengths",
+        "improvements",
+        "suggestions",
+        "follow_up",
+    ],
+}
+
+
+class DeadlineClient:
+    """Gemini service client that gives every request a deadline
+
+    google-generativeai 0.3.2 has no per-request timeout option, so the timeout
+    is passed to the underlying gRPC call instead. A request that runs out of
+    time fails with DeadlineExceeded and frees its pool thread, rather than
+    running on after the caller has stopped waiting for it. For streamed
+    responses the deadline covers the whole stream.
+    """
+
+    def __init__(self, factory, timeout):
+        """
+        Args:
+            factory (callable): Creates the wrapped client on first use
+            timeout (float): Deadline in seconds for each request
+        """
+        self._factory = factory
+        self._client = None
+        self.timeout = timeout
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = self._factory()
+        return self._client
+
+    def generate_content(self, request, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return self.client.generate_content(request, **kwargs)
+
+    def stream_generate_content(self, request, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return self.client.stream_generate_content(request, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+
+def empty_resume_data():
+    """Basic resume structure returned when parsing fails"""
+    return {
+        "name": "Unknown",
+        "email": "",
+        "phone": "",
+        "skills": [],
+        "education": [],
+        "experience": [],
+        "projects": [],
+        "certifications": [],
+    }
+
 
 class InterviewEngine:
-    def __init__(self, language="en"):
+    def __init__(self, language="en", model_name=None):
         """Initialize the interview engine with language support
 
         Args:
             language (str): Language code (e.g., 'en', 'vi')
+            model_name (str): Gemini model name, defaults to Config.GEMINI_MODEL
         """
         self.language = language
+        self.model_name = model_name or Config.GEMINI_MODEL
 
         # Configure TF-IDF vectorizer based on language
         language_config = Config.SUPPORTED_LANGUAGES.get(
@@ -31,11 +128,24 @@ class InterviewEngine:
             # For languages without built-in stopwords, use no stopwords
             self.vectorizer = TfidfVectorizer(max_features=1000, stop_words=None)
 
-        self.model = genai.GenerativeModel("gemini-2.5-flash-lite-preview-06-17")
+        self.model = genai.GenerativeModel(self.model_name)
+        # The model creates its client lazily; give it one with request deadlines
+        self.model._client = DeadlineClient(
+            genai_client.get_default_generative_client, Config.AI_CALL_TIMEOUT
+        )
 
     def parse_resume(self, text_content):
         """Parse resume text into structured data using Gemini AI"""
-        prompt = f"""
+        try:
+            response = self.model.generate_content(self._resume_prompt(text_content))
+            return self._extract_json(response.text)
+        except Exception as e:
+            print(f"Error parsing resume: {e}")
+            # Return basic structure if parsing fails
+            return empty_resume_data()
+
+    def _resume_prompt(self, text_content):
+        return f"""
         Parse this resume text into structured JSON format. Return ONLY valid JSON with these exact fields:
         {{
             "name": "Full Name",
@@ -71,32 +181,24 @@ class InterviewEngine:
         {text_content}
         """
 
+    def _extract_json(self, response_text):
+        """Load JSON from a model response, stripping any markdown code fences"""
+        response_text = response_text.strip()
+        response_text = re.sub(r"```json\s*", "", response_text)
+        response_text = re.sub(r"```\s*", "", response_text)
+        return json.loads(response_text)
+
+    def generate_questions(self, resume_data, language="en"):
+        """Generate interview questions based on resume data in specified language"""
         try:
+            prompt = self._questions_prompt(resume_data, language)
             response = self.model.generate_content(prompt)
-            # Clean the response to extract only JSON
-            response_text = response.text.strip()
-            # Remove any markdown formatting
-            response_text = re.sub(r"```json\s*", "", response_text)
-            response_text = re.sub(r"```\s*", "", response_text)
-
-            parsed_data = json.loads(response_text)
-            return parsed_data
+            return self._parse_questions(response.text)
         except Exception as e:
-            print(f"Error parsing resume: {e}")
-            # Return basic structure if parsing fails
-            return {
-                "name": "Unknown",
-                "email": "",
-                "phone": "",
-                "skills": [],
-                "education": [],
-                "experience": [],
-                "projects": [],
-                "certifications": [],
-            }
+            print(f"Error generating questions: {e}")
+            return self._fallback_questions(language)
 
-    def generate_questions(self, resume_data, language="en"):
-        """Generate interview questions based on resume data in specified language"""
+    def _questions_prompt(self, resume_data, language):
         skills = ", ".join(resume_data.get("skills", []))
         experience = resume_data.get("experience", [])
         projects = resume_data.get("projects", [])
@@ -109,7 +211,7 @@ class InterviewEngine:
         language_name = language_info["name"]
 
         if language == "vi":
-            prompt = f"""
+            return f"""
             Dựa trên hồ sơ của ứng viên này, hãy tạo chính xác {num_questions} câu hỏi phỏng vấn bằng tiếng Việt.
 
             Hồ sơ ứng viên:
@@ -127,7 +229,7 @@ class InterviewEngine:
             Trả về mỗi câu hỏi trên một dòng mới, đánh số từ 1-{num_questions}.
             """
         else:
-            prompt = f"""
+            return f"""
             Based on this candidate's profile, generate exactly {num_questions} interview questions in {language_name}.
 
             Candidate Profile:
@@ -145,140 +247,303 @@ class InterviewEngine:
             Return each question on a new line, numbered 1-{num_questions}.
             """
 
+    def _parse_questions(self, response_text):
+        """Extract the numbered questions from a question-generation response"""
+        questions = []
+        for line in response_text.split("\n"):
+            line = line.strip()
+            if line and (line[0].isdigit() or line.startswith("-")):
+                # Remove numbering and clean up
+                question = re.sub(r"^\d+\.?\s*", "", line)
+                question = re.sub(r"^-\s*", "", question)
+                if question:
+                    questions.append(question.strip())
+        # Ensure we return exactly the configured number of questions
+        return questions[: Config.NUM_INTERVIEW_QUESTIONS]
+
+    def _fallback_questions(self, language):
+        """Fallback questions in the appropriate language"""
+        if language == "vi":
+            return [
+                "Hãy kể về bản thân và nền tảng của bạn.",
+                "Điểm mạnh lớn nhất của bạn là gì?",
+                "Mô tả một dự án thử thách mà bạn đã làm.",
+                "Bạn xử lý deadline gấp như thế nào?",
+                "Điều gì khiến bạn quan tâm đến vị trí này?",
+                "Kể về một lần bạn làm việc trong nhóm.",
+                "Bạn cập nhật công nghệ mới như thế nào?",
+                "Mục tiêu nghề nghiệp của bạn là gì?",
+                "Mô tả một vấn đề bạn đã giải quyết một cách sáng tạo.",
+                "Tại sao chúng tôi nên tuyển bạn?",
+            ]
+        else:
+            return [
+                "Tell me about yourself and your background.",
+                "What are your greatest strengths?",
+                "Describe a challenging project you worked on.",
+                "How do you handle tight deadlines?",
+                "What interests you about this role?",
+                "Tell me about a time you worked in a team.",
+                "How do you stay updated with new technologies?",
+                "What are your career goals?",
+                "Describe a problem you solved creatively.",
+                "Why should we hire you?",
+            ]
+
+    def evaluate_answer(self, question, answer, ideal_answer=None):
+        """Evaluate interview answer using AI and similarity scoring
+
+        Args:
+            question (str): Interview question
+            answer (str): Candidate's answer
+            ideal_answer (str): Already generated (e.g. prefetched) ideal answer;
+                fetched from the cache or generated when omitted
+        """
+        if not answer.strip():
+            return self._empty_answer_evaluation()
+
         try:
-            response = self.model.generate_content(prompt)
-            questions = []
-            for line in response.text.split("\n"):
-                line = line.strip()
-                if line and (line[0].isdigit() or line.startswith("-")):
-                    # Remove numbering and clean up
-                    question = re.sub(r"^\d+\.?\s*", "", line)
-                    question = re.sub(r"^-\s*", "", question)
-                    if question:
-                        questions.append(question.strip())
-            # Ensure we return exactly the configured number of questions
-            return questions[:num_questions]
+            # Get ideal answer for comparison
+            if not ideal_answer:
+                ideal_answer = self.get_ideal_answer(question)
+
+            # Generate detailed feedback
+            feedback_prompt = self._feedback_prompt(question, answer, ideal_answer)
+            feedback_response = self.model.generate_content(feedback_prompt)
+
+            return self._build_evaluation(
+                answer, ideal_answer, feedback_response.text.strip()
+            )
+
         except Exception as e:
-            print(f"Error generating questions: {e}")
-            # Return fallback questions in the appropriate language
-            if language == "vi":
-                return [
-                    "Hãy kể về bản thân và nền tảng của bạn.",
-                    "Điểm mạnh lớn nhất của bạn là gì?",
-                    "Mô tả một dự án thử thách mà bạn đã làm.",
-                    "Bạn xử lý deadline gấp như thế nào?",
-                    "Điều gì khiến bạn quan tâm đến vị trí này?",
-                    "Kể về một lần bạn làm việc trong nhóm.",
-                    "Bạn cập nhật công nghệ mới như thế nào?",
-                    "Mục tiêu nghề nghiệp của bạn là gì?",
-                    "Mô tả một vấn đề bạn đã giải quyết một cách sáng tạo.",
-                    "Tại sao chúng tôi nên tuyển bạn?",
-                ]
-            else:
-                return [
-                    "Tell me about yourself and your background.",
-                    "What are your greatest strengths?",
-                    "Describe a challenging project you worked on.",
-                    "How do you handle tight deadlines?",
-                    "What interests you about this role?",
-                    "Tell me about a time you worked in a team.",
-                    "How do you stay updated with new technologies?",
-                    "What are your career goals?",
-                    "Describe a problem you solved creatively.",
-                    "Why should we hire you?",
-                ]
-
-    def evaluate_answer(self, question, answer):
-        """Evaluate interview answer using AI and similarity scoring"""
-        if not answer.strip():
-            return {
-                "score": 0,
-                "feedback": "No answer provided.",
-                "strengths": [],
-                "improvements": ["Provide a complete answer to the question."],
-                "suggestions": [
-                    "Take time to think about your response before answering."
-                ],
-            }
+            print(f"Error evaluating answer: {e}")
+            return self._fallback_evaluation(answer)
 
-        # Generate ideal answer for comparison
-        ideal_prompt = f"""
-        Provide a concise, professional answer (100-150 words) to this interview question:
-        "{question}"
+    def _empty_answer_evaluation(self):
+        return {
+            "score": 0,
+            "feedback": "No answer provided.",
+            "strengths": [],
+            "improvements": ["Provide a complete answer to the question."],
+            "suggestions": ["Take time to think about your response before answering."],
+        }
 
-        Focus on being specific, relevant, and showing competence.
+    def _feedback_prompt(self, question, answer, ideal_answer):
+        return f"""
+        Evaluate this interview answer and provide constructive feedback:
+
+        Question: "{question}"
+
+        Candidate's Answer: "{answer}"
+
+        Ideal Answer: "{ideal_answer}"
+
+        Provide feedback in this exact format:
+        SCORE: [number from 0-100]
+        STRENGTHS: [list 2-3 positive aspects]
+        IMPROVEMENTS: [list 2-3 areas to improve]
+        SUGGESTIONS: [list 2-3 specific suggestions]
+
+        Be constructive and specific in your feedback.
         """
 
-        try:
-            ideal_response = self.model.generate_content(ideal_prompt)
-            ideal_answer = ideal_response.text.strip()
+    def _build_evaluation(self, answer, ideal_answer, feedback_text):
+        """Combine parsed AI feedback with the TF-IDF similarity score"""
+        # Calculate similarity using TF-IDF
+        similarity_score = self._calculate_similarity(ideal_answer, answer)
 
-            # Calculate similarity using TF-IDF
-            similarity_score = self._calculate_similarity(ideal_answer, answer)
+        # Parse feedback
+        parsed_feedback = self._parse_feedback(feedback_text)
 
-            # Generate detailed feedback
-            feedback_prompt = f"""
-            Evaluate this interview answer and provide constructive feedback:
+        # Combine AI score with similarity score
+        ai_score = parsed_feedback.get("score", similarity_score)
+        final_score = round((ai_score + similarity_score) / 2, 1)
 
-            Question: "{question}"
+        return {
+            "score": final_score,
+            "feedback": feedback_text,
+            "strengths": parsed_feedback.get("strengths", []),
+            "improvements": parsed_feedback.get("improvements", []),
+            "suggestions": parsed_feedback.get("suggestions", []),
+            "ideal_answer": ideal_answer,
+        }
 
-            Candidate's Answer: "{answer}"
+    def evaluate_fused(self, question, answer, ideal_answer=None):
+        """Evaluate an answer and generate its follow-up in a single Gemini call
 
-            Ideal Answer: "{ideal_answer}"
+        The model is asked for one JSON object matching FUSED_EVALUATION_SCHEMA
+        holding the ideal answer, score, feedback lists and follow-up question.
+        When the ideal answer is already known it is given to the model as the
+        reference and left out of the requested fields.
 
-            Provide feedback in this exact format:
-            SCORE: [number from 0-100]
-            STRENGTHS: [list 2-3 positive aspects]
-            IMPROVEMENTS: [list 2-3 areas to improve]
-            SUGGESTIONS: [list 2-3 specific suggestions]
+        Returns:
+            tuple: (evaluation dict, follow-up question)
 
-            Be constructive and specific in your feedback.
-            """
+        Raises:
+            ValueError: If the response does not match the schema
+        """
+        prompt, schema = self._fused_prompt(question, answer, ideal_answer)
+        response = self.model.generate_content(prompt)
+        return self._build_fused_result(
+            question, answer, ideal_answer, schema, response.text
+        )
 
-            feedback_response = self.model.generate_content(feedback_prompt)
-            feedback_text = feedback_response.text.strip()
+    def _fused_prompt(self, question, answer, ideal_answer=None):
+        """Build the fused evaluation prompt and the schema it asks for"""
+        schema = self._fused_schema(include_ideal=not ideal_answer)
+        if ideal_answer:
+            reference = f'Ideal Answer: "{ideal_answer}"'
+            ideal_guidance = ""
+        else:
+            reference = ""
+            ideal_guidance = (
+                "- ideal_answer: a concise, professional answer "
+                "(100-150 words) to the question"
+            )
 
-            # Parse feedback
-            parsed_feedback = self._parse_feedback(feedback_text)
+        prompt = f"""
+        You are evaluating a candidate's interview answer.
 
-            # Combine AI score with similarity score
-            ai_score = parsed_feedback.get("score", similarity_score)
-            final_score = round((ai_score + similarity_score) / 2, 1)
+        Question: "{question}"
 
-            return {
-                "score": final_score,
-                "feedback": feedback_text,
-                "strengths": parsed_feedback.get("strengths", []),
-                "improvements": parsed_feedback.get("improvements", []),
-                "suggestions": parsed_feedback.get("suggestions", []),
-                "ideal_answer": ideal_answer,
-            }
+        Candidate's Answer: "{answer}"
 
-        except Exception as e:
-            print(f"Error evaluating answer: {e}")
-            # Fallback evaluation
-            word_count = len(answer.split())
-            basic_score = min(word_count * 2, 100) if word_count > 0 else 0
+        {reference}
 
-            return {
-                "score": basic_score,
-                "feedback": "Answer evaluated. Provide more specific examples and details.",
-                "strengths": ["Attempted to answer the question"],
-                "improvements": [
-                    "Provide more specific examples",
-                    "Elaborate on key points",
-                ],
-                "suggestions": [
-                    "Use the STAR method for behavioral questions",
-                    "Include concrete examples",
-                ],
-                "ideal_answer": "A comprehensive answer with specific examples and clear explanations.",
-            }
+        Return ONLY a JSON object that validates against this JSON schema:
+        {json.dumps(schema, indent=2)}
+
+        Field guidance:
+        {ideal_guidance}
+        - score: the candidate's score from 0-100
+        - feedback: 2-3 sentences of constructive, specific feedback
+        - strengths: 2-3 positive aspects of the answer
+        - improvements: 2-3 areas to improve
+        - suggestions: 2-3 specific suggestions
+        - follow_up: a follow-up question that builds on the answer and seeks more specific details
+        """
+        return prompt, schema
+
+    def _build_fused_result(self, question, answer, ideal_answer, schema, text):
+        """Validate a fused response and turn it into (evaluation, follow-up)"""
+        data = self._extract_json(text)
+
+        error = self._validate_fused_evaluation(data, schema)
+        if error:
+            raise ValueError(f"Invalid fused evaluation: {error}")
+
+        if not ideal_answer:
+            ideal_answer = data["ideal_answer"].strip()
+            ideal_answer_cache.set(question, self.language, ideal_answer)
+        similarity_score = self._calculate_similarity(ideal_answer, answer)
+        ai_score = min(max(float(data["score"]), 0), 100)
+
+        evaluation = {
+            "score": round((ai_score + similarity_score) / 2, 1),
+            "feedback": data["feedback"].strip(),
+            "strengths": data["strengths"],
+            "improvements": data["improvements"],
+            "suggestions": data["suggestions"],
+            "ideal_answer": ideal_answer,
+        }
+        return evaluation, data["follow_up"].strip()
+
+    def _fused_schema(self, include_ideal=True):
+        """FUSED_EVALUATION_SCHEMA, optionally without the ideal_answer field"""
+        if include_ideal:
+            return FUSED_EVALUATION_SCHEMA
+
+        return {
+            "type": "object",
+            "properties": {
+                field: spec
+                for field, spec in FUSED_EVALUATION_SCHEMA["properties"].items()
+                if field != "ideal_answer"
+            },
+            "required": [
+                field
+                for field in FUSED_EVALUATION_SCHEMA["required"]
+                if field != "ideal_answer"
+            ],
+        }
+
+    def _validate_fused_evaluation(self, data, schema=FUSED_EVALUATION_SCHEMA):
+        """Check a fused evaluation against its JSON schema
+
+        Returns:
+            str: Description of the first violation, or None if the data is valid
+        """
+        if not isinstance(data, dict):
+            return "response is not a JSON object"
+
+        type_map = {"string": str, "number": (int, float), "array": list}
+        for field in schema["required"]:
+            if field not in data:
+                return f"missing field '{field}'"
+
+            spec = schema["properties"][field]
+            value = data[field]
+            if isinstance(value, bool) or not isinstance(value, type_map[spec["type"]]):
+                return f"field '{field}' must be of type {spec['type']}"
+            if spec["type"] == "number" and not (
+                spec["minimum"] <= value <= spec["maximum"]
+            ):
+                return f"field '{field}' is out of range"
+            if spec["type"] == "array" and not all(isinstance(v, str) for v in value):
+                return f"field '{field}' must contain only strings"
+            if spec["type"] == "string" and not value.strip():
+                return f"field '{field}' is empty"
+
+        return None
+
+    def get_ideal_answer(self, question):
+        """Return the ideal answer to a question, generating it on a cache miss"""
+        cached = ideal_answer_cache.get(question, self.language)
+        if cached:
+            return cached
+
+        ideal_response = self.model.generate_content(
+            self._ideal_answer_prompt(question)
+        )
+        ideal_answer = ideal_response.text.strip()
+        if ideal_answer:
+            ideal_answer_cache.set(question, self.language, ideal_answer)
+        return ideal_answer
+
+    def _ideal_answer_prompt(self, question):
+        return f"""
+        Provide a concise, professional answer (100-150 words) to this interview question:
+        "{question}"
+
+        Focus on being specific, relevant, and showing competence.
+        """
+
+    def _fallback_evaluation(self, answer):
+        """Basic word-count evaluation used when the AI evaluation is unavailable"""
+        word_count = len(answer.split())
+        basic_score = min(word_count * 2, 100) if word_count > 0 else 0
+
+        return {
+            "score": basic_score,
+            "feedback": "Answer evaluated. Provide more specific examples and details.",
+            "strengths": ["Attempted to answer the question"],
+            "improvements": [
+                "Provide more specific examples",
+                "Elaborate on key points",
+            ],
+            "suggestions": [
+                "Use the STAR method for behavioral questions",
+                "Include concrete examples",
+            ],
+            "ideal_answer": "A comprehensive answer with specific examples and clear explanations.",
+        }
 
     def _calculate_similarity(self, text1, text2):
         """Calculate similarity between two texts using TF-IDF"""
         try:
-            tfidf_matrix = self.vectorizer.fit_transform([text1, text2])
+            # Engines are shared between request threads (see EnginePool), so fit
+            # a fresh copy of the configured vectorizer instead of mutating it
+            tfidf_matrix = clone(self.vectorizer).fit_transform([text1, text2])
             similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
             return round(similarity * 100, 1)
         except:
@@ -331,7 +596,16 @@ class InterviewEngine:
 
     def generate_follow_up(self, question, answer):
         """Generate follow-up question based on the answer"""
-        prompt = f"""
+        try:
+            prompt = self._follow_up_prompt(question, answer)
+            response = self.model.generate_content(prompt)
+            return response.text.strip()
+        except Exception as e:
+            print(f"Error generating follow-up: {e}")
+            return DEFAULT_FOLLOW_UP
+
+    def _follow_up_prompt(self, question, answer):
+        return f"""
         Based on this interview exchange, generate a relevant follow-up question:
 
         Original Question: "{question}"
@@ -345,22 +619,147 @@ class InterviewEngine:
         Return only the follow-up question.
         """
 
+    def evaluate_with_follow_up(self, question, answer, ideal_answer=None):
+        """Evaluate an answer and generate a follow-up question for it
+
+        With Config.AI_CONCURRENT_EVALUATION enabled, the follow-up prompt runs on
+        the shared thread pool alongside the evaluation calls, so the wall-clock
+        time is that of the slower branch. Each branch is bounded by
+        Config.AI_CALL_TIMEOUT per Gemini call and falls back to a default
+        result when it runs out of time.
+
+        In "fused" Config.AI_EVALUATION_MODE a single structured call is made
+        instead, falling back to the standard calls if it fails validation.
+
+        A known (e.g. prefetched) ideal_answer saves the ideal-answer call.
+
+        Returns:
+            tuple: (evaluation dict, follow-up question)
+        """
+        if Config.AI_EVALUATION_MODE == "fused" and answer.strip():
+            result = self._wait_for(
+                _ai_executor.submit(
+                    self.evaluate_fused, question, answer, ideal_answer
+                ),
+                Config.AI_CALL_TIMEOUT,
+                lambda: None,
+            )
+            if result is not None:
+                return result
+            print("Fused evaluation unavailable, using standard evaluation")
+
+        if not Config.AI_CONCURRENT_EVALUATION:
+            evaluation = self.evaluate_answer(question, answer, ideal_answer)
+            return evaluation, self.generate_follow_up(question, answer)
+
+        evaluation_future = _ai_executor.submit(
+            self.evaluate_answer, question, answer, ideal_answer
+        )
+        follow_up_future = _ai_executor.submit(
+            self.generate_follow_up, question, answer
+        )
+
+        # Evaluation makes up to two sequential calls (ideal answer, then feedback)
+        evaluation_calls = 1 if ideal_answer else 2
+        evaluation = self._wait_for(
+            evaluation_future,
+            Config.AI_CALL_TIMEOUT * evaluation_calls,
+            lambda: self._fallback_evaluation(answer),
+        )
+        follow_up = self._wait_for(
+            follow_up_future, Config.AI_CALL_TIMEOUT, lambda: DEFAULT_FOLLOW_UP
+        )
+        return evaluation, follow_up
+
+    def stream_evaluation(self, question, answer, ideal_answer=None):
+        """Streaming variant of evaluate_with_follow_up
+
+        Yields ("feedback", text) events as feedback tokens arrive, then one
+        ("result", (evaluation, follow_up)) event. The evaluation is built the
+        same way as evaluate_answer, and the follow-up is generated on the
+        fan-out pool while the feedback streams. The fused mode has no
+        incremental text, so its feedback is yielded in one piece.
+
+        The ideal-answer request and the feedback stream each carry the
+        Config.AI_CALL_TIMEOUT request deadline (see DeadlineClient), so a
+        stalled stream ends in the fallback evaluation instead of holding the
+        worker.
+        """
+        if Config.AI_EVALUATION_MODE == "fused" and answer.strip():
+            evaluation, follow_up = self.evaluate_with_follow_up(
+                question, answer, ideal_answer
+            )
+            yield "feedback", evaluation.get("feedback", "")
+            yield "result", (evaluation, follow_up)
+            return
+
+        follow_up_future = _ai_executor.submit(
+            self.generate_follow_up, question, answer
+        )
+
+        if not answer.strip():
+            evaluation = self._empty_answer_evaluation()
+        else:
+            try:
+                if not ideal_answer:
+                    ideal_answer = self.get_ideal_answer(question)
+
+                feedback_prompt = self._feedback_prompt(question, answer, ideal_answer)
+                chunks = []
+                for chunk in self.model.generate_content(feedback_prompt, stream=True):
+                    chunks.append(chunk.text)
+                    yield "feedback", chunk.text
+
+                evaluation = self._build_evaluation(
+                    answer, ideal_answer, "".join(chunks).strip()
+                )
+            except Exception as e:
+                print(f"Error evaluating answer: {e}")
+                evaluation = self._fallback_evaluation(answer)
+
+        follow_up = self._wait_for(
+            follow_up_future, Config.AI_CALL_TIMEOUT, lambda: DEFAULT_FOLLOW_UP
+        )
+        yield "result", (evaluation, follow_up)
+
+    def _wait_for(self, future, timeout, fallback):
+        """Wait for a fan-out future, returning fallback() on timeout or error
+
+        Cancelling only stops a call that has not started. A running call is
+        ended by its own request deadline (see DeadlineClient), so abandoned
+        calls do not keep holding pool threads.
+        """
         try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            print(f"AI call timed out after {timeout:.0f}s")
+            future.cancel()
+            return fallback()
         except Exception as e:
-            print(f"Error generating follow-up: {e}")
-            return "Can you provide a specific example to illustrate your point?"
+            print(f"AI call failed: {e}")
+            return fallback()
 
     def generate_overall_evaluation(self, transcript, evaluations):
         """Generate overall interview evaluation"""
-        avg_score = (
+        avg_score = self._average_score(evaluations)
+
+        try:
+            prompt = self._overall_prompt(transcript, avg_score)
+            response = self.model.generate_content(prompt)
+            return self._parse_overall_evaluation(response.text)
+        except Exception as e:
+            print(f"Error generating overall evaluation: {e}")
+            return self._fallback_overall_evaluation(avg_score)
+
+    def _average_score(self, evaluations):
+        return (
             np.mean([eval_data.get("score", 0) for eval_data in evaluations])
             if evaluations
             else 0
         )
 
-        prompt = f"""
+    def _overall_prompt(self, transcript, avg_score):
+        return f"""
         Based on this complete interview transcript and performance, provide an overall evaluation:
 
         Average Score: {avg_score:.1f}/100
@@ -379,21 +778,17 @@ class InterviewEngine:
         RECOMMENDATIONS: [3-4 specific recommendations]
         """
 
-        try:
-            response = self.model.generate_content(prompt)
-            return self._parse_overall_evaluation(response.text)
-        except Exception as e:
-            print(f"Error generating overall evaluation: {e}")
-            return {
-                "overall_score": avg_score,
-                "technical_skills": avg_score,
-                "communication": avg_score,
-                "problem_solving": avg_score,
-                "summary": "Interview completed with average performance.",
-                "strengths": ["Attempted all questions"],
-                "areas_for_improvement": ["Provide more specific examples"],
-                "recommendations": ["Practice common interview questions"],
-            }
+    def _fallback_overall_evaluation(self, avg_score):
+        return {
+            "overall_score": avg_score,
+            "technical_skills": avg_score,
+            "communication": avg_score,
+            "problem_solving": avg_score,
+            "summary": "Interview completed with average performance.",
+            "strengths": ["Attempted all questions"],
+            "areas_for_improvement": ["Provide more specific examples"],
+            "recommendations": ["Practice common interview questions"],
+        }
 
     def _parse_overall_evaluation(self, evaluation_text):
         """Parse overall evaluation response"""
@@ -434,3 +829,248 @@ class InterviewEngine:
                 result[field] = f"No {field.replace('_', ' ')} provided."
 
         return result
+
+
+class IdealAnswerCache:
+    """Two-level cache of generated ideal answers
+
+    Entries are keyed by a hash of the normalized question plus the interview
+    language. An in-memory LRU sits in front of a persistent SQLite table that
+    is shared by every worker process, so repeated questions (fallback and
+    common behavioral questions especially) skip a Gemini round-trip.
+    """
+
+    def __init__(self):
+        self.enabled = Config.IDEAL_ANSWER_CACHE_ENABLED
+        self.memory = LRUCache(
+            maxsize=Config.IDEAL_ANSWER_CACHE_SIZE, ttl=Config.IDEAL_ANSWER_CACHE_TTL
+        )
+        self.store = SQLiteCache(
+            Config.CACHE_DB_PATH,
+            "ideal_answers",
+            ttl=Config.IDEAL_ANSWER_CACHE_TTL,
+            max_rows=Config.IDEAL_ANSWER_CACHE_MAX_ROWS,
+        )
+        self._lock = threading.Lock()
+        self.store_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize_question(question):
+        """Lowercase, collapse whitespace and strip quotes/trailing punctuation"""
+        question = re.sub(r"\s+", " ", question.strip().lower())
+        return question.strip("\"'").rstrip(" ?.!")
+
+    def make_key(self, question, language):
+        digest = hashlib.sha256(self.normalize_question(question).encode("utf-8"))
+        return f"{language}:{digest.hexdigest()}"
+
+    def get(self, question, language):
+        """Return the cached ideal answer, or None on a miss"""
+        if not self.enabled:
+            return None
+
+        key = self.make_key(question, language)
+        answer = self.memory.get(key)
+        if answer is not None:
+            return answer
+
+        answer = self.store.get(key)
+        with self._lock:
+            if answer is None:
+                self.misses += 1
+                return None
+            self.store_hits += 1
+
+        # Promote to memory for subsequent lookups
+        self.memory.set(key, answer)
+        return answer
+
+    def set(self, question, language, answer):
+        if not self.enabled:
+            return
+
+        key = self.make_key(question, language)
+        self.memory.set(key, answer)
+        self.store.set(key, answer)
+
+    def stats(self):
+        """Return memory/store hit counters and the overall hit ratio"""
+        memory_stats = self.memory.stats()
+        with self._lock:
+            hits = memory_stats["hits"] + self.store_hits
+            lookups = hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "memory": memory_stats,
+                "store_hits": self.store_hits,
+                "misses": self.misses,
+                "hit_ratio": round(hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+# Shared ideal-answer cache
+ideal_answer_cache = IdealAnswerCache()
+
+
+class IdealAnswerPrefetcher:
+    """Background generation of ideal answers for an interview's questions
+
+    Ideal answers are generated on a background pool while the candidate is
+    still answering. Futures are tracked per interview, and finished answers
+    also land in the ideal-answer cache, so other worker processes can use
+    them as well.
+    """
+
+    # Interviews tracked at once; the oldest are dropped beyond this
+    MAX_INTERVIEWS = 256
+
+    def __init__(self):
+        self._futures = OrderedDict()
+        self._lock = threading.Lock()
+        self.used = 0
+        self.waited = 0
+        self.not_ready = 0
+
+    def prefetch(self, interview_id, questions, engine):
+        """Queue ideal-answer generation for each question of an interview"""
+        futures = {}
+        for question in questions:
+            key = ideal_answer_cache.normalize_question(question)
+            if key not in futures:
+                futures[key] = _prefetch_executor.submit(
+                    engine.get_ideal_answer, question
+                )
+
+        with self._lock:
+            self._futures[interview_id] = futures
+            while len(self._futures) > self.MAX_INTERVIEWS:
+                _, dropped = self._futures.popitem(last=False)
+                for future in dropped.values():
+                    future.cancel()
+
+    def get(self, interview_id, question, engine, timeout=None):
+        """Return the prefetched ideal answer, or None if there is none
+
+        A prefetch that is still running is waited on for up to timeout
+        seconds (default Config.AI_CALL_TIMEOUT, the deadline of the request
+        itself) rather than generating the same answer again. One still
+        queued behind other prefetches is cancelled so the caller can
+        generate it now. Falls back to the shared cache, which covers answers
+        prefetched by another worker process.
+        """
+        timeout = Config.AI_CALL_TIMEOUT if timeout is None else timeout
+        key = ideal_answer_cache.normalize_question(question)
+        with self._lock:
+            future = self._futures.get(interview_id, {}).get(key)
+
+        waited = False
+        if future is not None and not future.done() and not future.cancel():
+            waited = True
+            try:
+                future.result(timeout=timeout)
+            except Exception:
+                pass
+
+        if future is not None and future.done() and not future.cancelled():
+            try:
+                answer = future.result()
+            except Exception as e:
+                print(f"Ideal answer prefetch failed: {e}")
+                answer = None
+        else:
+            answer = ideal_answer_cache.get(question, engine.language)
+
+        with self._lock:
+            if answer:
+                self.used += 1
+                if waited:
+                    self.waited += 1
+            else:
+                self.not_ready += 1
+        return answer or None
+
+    def discard(self, interview_id):
+        """Forget an interview's prefetch state, cancelling pending work"""
+        with self._lock:
+            futures = self._futures.pop(interview_id, {})
+        for future in futures.values():
+            future.cancel()
+
+    def stats(self):
+        with self._lock:
+            pending = sum(
+                1
+                for futures in self._futures.values()
+                for future in futures.values()
+                if not future.done()
+            )
+            return {
+                "interviews": len(self._futures),
+                "pending": pending,
+                "used": self.used,
+                "waited": self.waited,
+                "not_ready": self.not_ready,
+            }
+
+
+# Shared ideal-answer prefetcher
+ideal_answer_prefetcher = IdealAnswerPrefetcher()
+
+
+class EnginePool:
+    """Process-wide, thread-safe registry of InterviewEngine instances
+
+    Engines are keyed by (language, model name) and reused across requests so the
+    Gemini model and TF-IDF vectorizer are only built once per process.
+    """
+
+    def __init__(self):
+        self._engines = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, language, model_name):
+        if language not in Config.SUPPORTED_LANGUAGES:
+            language = Config.DEFAULT_LANGUAGE
+        return language, model_name or Config.GEMINI_MODEL
+
+    def get(self, language=None, model_name=None):
+        """Return the shared engine for a language, creating it on first use"""
+        key = self._key(language, model_name)
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is not None:
+                self.hits += 1
+                return engine
+
+            self.misses += 1
+            engine = InterviewEngine(language=key[0], model_name=key[1])
+            self._engines[key] = engine
+            return engine
+
+    def warm(self, languages=None, model_name=None):
+        """Pre-build engines for the given (default: all supported) languages"""
+        for language in languages or Config.SUPPORTED_LANGUAGES:
+            key = self._key(language, model_name)
+            with self._lock:
+                if key not in self._engines:
+                    self._engines[key] = InterviewEngine(
+                        language=key[0], model_name=key[1]
+                    )
+
+    def stats(self):
+        """Return pool size and hit/miss counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "engines": [f"{lang}:{model}" for lang, model in self._engines],
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+# Shared engine registry used by the routes
+engine_pool = EnginePool()
@@ -0,0 +1,79 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from config import Config
+from models.answer_job import AnswerJob
+from models.db import db
+
+
+class AnswerJobError(Exception):
+    """Job failure whose message can be shown to the candidate"""
+
+
+class AnswerJobRunner:
+    """Runs answer processing jobs on a background thread pool
+
+    Lets /api/interview/process return 202 Accepted straight away, so slow
+    transcription and evaluation do not hold a web worker or run into the
+    gunicorn request timeout. Job state is stored in the answer_jobs table, so
+    any worker can report the status of any job.
+    """
+
+    def __init__(self, max_workers=None):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or Config.ANSWER_JOB_WORKERS,
+            thread_name_prefix="answer-job",
+        )
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+
+    def submit(self, app, job_id, func, *args):
+        """Run func(job, *args) for the given job inside an app context
+
+        func updates the job status as it goes and returns the result payload.
+        An AnswerJobError marks the job failed with its message; any other
+        exception marks it failed with a generic message.
+        """
+        with self._lock:
+            self.submitted += 1
+        self._executor.submit(self._run, app, job_id, func, *args)
+
+    def _run(self, app, job_id, func, *args):
+        with self._lock:
+            self.running += 1
+
+        with app.app_context():
+            job = AnswerJob.query.get(job_id)
+            try:
+                result = func(job, *args)
+                job.set_status(AnswerJob.DONE, result=result)
+            except Exception as e:
+                print(f"Answer job {job_id} failed: {e}")
+                with self._lock:
+                    self.failed += 1
+                error = (
+                    str(e)
+                    if isinstance(e, AnswerJobError)
+                    else "Failed to process answer. Please try again."
+                )
+                db.session.rollback()
+                job.set_status(AnswerJob.FAILED, error=error)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+
+    def stats(self):
+        """Job counts for this process"""
+        with self._lock:
+            return {
+                "submitted": self.submitted,
+                "queued": self.submitted - self.running - self.completed,
+                "running": self.running,
+                "failed": self.failed,
+            }
+
+
+answer_job_runner = AnswerJobRunner()
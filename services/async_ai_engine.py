@@ -0,0 +1,171 @@
+import asyncio
+import functools
+from config import Config
+from services.ai_engine import (
+    DEFAULT_FOLLOW_UP,
+    empty_resume_data,
+    engine_pool,
+    ideal_answer_cache,
+)
+
+
+def _run_blocking(func, *args):
+    """Run a blocking call in the loop's default executor
+
+    Equivalent to asyncio.to_thread, which needs Python 3.9.
+    """
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(None, functools.partial(func, *args))
+
+
+class AsyncInterviewEngine:
+    """Asynchronous counterpart of InterviewEngine
+
+    Wraps a pooled InterviewEngine, reusing its prompts, parsers and caches, but
+    issues Gemini requests with generate_content_async so a single worker can
+    keep many interviews in flight. Every method accepts a per-call deadline in
+    seconds (default Config.AI_CALL_TIMEOUT). A call that misses its deadline
+    is cancelled and the same fallback result as the sync engine is returned.
+    Cancelling the calling task cancels the pending Gemini request. Blocking
+    work (the SQLite-backed ideal-answer cache and TF-IDF scoring) runs in a
+    worker thread so it never stalls the event loop.
+    """
+
+    def __init__(self, language="en", model_name=None, engine=None, timeout=None):
+        """
+        Args:
+            language (str): Language code (e.g., 'en', 'vi')
+            model_name (str): Gemini model name, defaults to Config.GEMINI_MODEL
+            engine (InterviewEngine): Engine to wrap instead of the pooled one
+            timeout (float): Default per-call deadline in seconds
+        """
+        self.engine = engine or engine_pool.get(language, model_name)
+        self.language = self.engine.language
+        self.timeout = Config.AI_CALL_TIMEOUT if timeout is None else timeout
+
+    async def _generate(self, prompt, timeout=None):
+        """Run one Gemini request, cancelling it if the deadline passes"""
+        timeout = self.timeout if timeout is None else timeout
+        response = await asyncio.wait_for(
+            self.engine.model.generate_content_async(prompt), timeout
+        )
+        return response.text
+
+    async def parse_resume(self, text_content, timeout=None):
+        """Parse resume text into structured data"""
+        try:
+            text = await self._generate(
+                self.engine._resume_prompt(text_content), timeout
+            )
+            return self.engine._extract_json(text)
+        except Exception as e:
+            print(f"Error parsing resume: {e}")
+            return empty_resume_data()
+
+    async def generate_questions(self, resume_data, language="en", timeout=None):
+        """Generate interview questions based on resume data"""
+        try:
+            prompt = self.engine._questions_prompt(resume_data, language)
+            return self.engine._parse_questions(await self._generate(prompt, timeout))
+        except Exception as e:
+            print(f"Error generating questions: {e}")
+            return self.engine._fallback_questions(language)
+
+    async def get_ideal_answer(self, question, timeout=None):
+        """Return the ideal answer to a question, generating it on a cache miss"""
+        cached = await _run_blocking(ideal_answer_cache.get, question, self.language)
+        if cached:
+            return cached
+
+        text = await self._generate(self.engine._ideal_answer_prompt(question), timeout)
+        ideal_answer = text.strip()
+        if ideal_answer:
+            await _run_blocking(
+                ideal_answer_cache.set, question, self.language, ideal_answer
+            )
+        return ideal_answer
+
+    async def evaluate_answer(self, question, answer, ideal_answer=None, timeout=None):
+        """Evaluate an answer; the deadline applies to each Gemini call"""
+        if not answer.strip():
+            return self.engine._empty_answer_evaluation()
+
+        try:
+            if not ideal_answer:
+                ideal_answer = await self.get_ideal_answer(question, timeout)
+
+            feedback_prompt = self.engine._feedback_prompt(
+                question, answer, ideal_answer
+            )
+            feedback_text = await self._generate(feedback_prompt, timeout)
+            return await _run_blocking(
+                self.engine._build_evaluation,
+                answer,
+                ideal_answer,
+                feedback_text.strip(),
+            )
+        except Exception as e:
+            print(f"Error evaluating answer: {e}")
+            return self.engine._fallback_evaluation(answer)
+
+    async def evaluate_fused(self, question, answer, ideal_answer=None, timeout=None):
+        """Single-call evaluation and follow-up (see InterviewEngine.evaluate_fused)
+
+        Raises:
+            ValueError: If the response does not match the schema
+        """
+        prompt, schema = self.engine._fused_prompt(question, answer, ideal_answer)
+        text = await self._generate(prompt, timeout)
+        return await _run_blocking(
+            self.engine._build_fused_result,
+            question,
+            answer,
+            ideal_answer,
+            schema,
+            text,
+        )
+
+    async def generate_follow_up(self, question, answer, timeout=None):
+        """Generate follow-up question based on the answer"""
+        try:
+            prompt = self.engine._follow_up_prompt(question, answer)
+            return (await self._generate(prompt, timeout)).strip()
+        except Exception as e:
+            print(f"Error generating follow-up: {e}")
+            return DEFAULT_FOLLOW_UP
+
+    async def evaluate_with_follow_up(
+        self, question, answer, ideal_answer=None, timeout=None
+    ):
+        """Evaluate an answer and generate its follow-up concurrently
+
+        Honours Config.AI_EVALUATION_MODE like the sync engine.
+
+        Returns:
+            tuple: (evaluation dict, follow-up question)
+        """
+        if Config.AI_EVALUATION_MODE == "fused" and answer.strip():
+            try:
+                return await self.evaluate_fused(
+                    question, answer, ideal_answer, timeout
+                )
+            except Exception as e:
+                print(f"Fused evaluation unavailable, using standard evaluation: {e}")
+
+        evaluation, follow_up = await asyncio.gather(
+            self.evaluate_answer(question, answer, ideal_answer, timeout),
+            self.generate_follow_up(question, answer, timeout),
+        )
+        return evaluation, follow_up
+
+    async def generate_overall_evaluation(self, transcript, evaluations, timeout=None):
+        """Generate overall interview evaluation"""
+        avg_score = self.engine._average_score(evaluations)
+
+        try:
+            prompt = self.engine._overall_prompt(transcript, avg_score)
+            text = await self._generate(prompt, timeout)
+            return self.engine._parse_overall_evaluation(text)
+        except Exception as e:
+            print(f"Error generating overall evaluation: {e}")
+            return self.engine._fallback_overall_evaluation(avg_score)
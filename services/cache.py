@@ -0,0 +1,176 @@
+# Caching utilities shared by the AI and voice services
+from collections import OrderedDict
+from contextlib import closing
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU cache with an optional per-entry TTL"""
+
+    def __init__(self, maxsize=256, ttl=None):
+        """
+        Args:
+            maxsize (int): Maximum number of entries kept in memory
+            ttl (float): Seconds an entry stays valid, or None for no expiry
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """Return the cached value for key, or default if missing or expired"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                value, expires_at = item
+                if expires_at is None or expires_at > time.time():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        """Store a value, evicting the least recently used entries if full"""
+        expires_at = time.time() + self.ttl if self.ttl else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        """Return size and hit/miss counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+class SQLiteCache:
+    """Persistent key/value cache stored in a SQLite table
+
+    Values are JSON-encoded, so the cache is shared by every worker process
+    using the same database file. Entries older than ttl seconds are treated
+    as missing, and the table is trimmed to max_rows (oldest first) on write.
+    Database errors are logged and treated as cache misses.
+    """
+
+    # Trim expired/excess rows every N writes rather than on every write
+    TRIM_INTERVAL = 50
+
+    def __init__(self, path, table, ttl=None, max_rows=10000):
+        if not re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", table):
+            raise ValueError(f"Invalid cache table name: {table}")
+
+        self.path = path
+        self.table = table
+        self.ttl = ttl
+        self.max_rows = max_rows
+        self._ready = False
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def _connect(self):
+        if not self._ready:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        conn = sqlite3.connect(self.path, timeout=5)
+        if not self._ready:
+            with self._lock:
+                if not self._ready:
+                    conn.execute(
+                        f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                        "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                        "created_at REAL NOT NULL)"
+                    )
+                    conn.execute(
+                        f"CREATE INDEX IF NOT EXISTS ix_{self.table}_created_at "
+                        f"ON {self.table} (created_at)"
+                    )
+                    conn.commit()
+                    self._ready = True
+        return conn
+
+    def get(self, key, default=None):
+        """Return the stored value for key, or default if missing or expired"""
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    f"SELECT value, created_at FROM {self.table} WHERE key = ?",
+                    (key,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Cache read error ({self.table}): {e}")
+            return default
+
+        if row is None:
+            return default
+
+        value, created_at = row
+        if self.ttl and created_at + self.ttl < time.time():
+            return default
+        return json.loads(value)
+
+    def set(self, key, value):
+        """Store a JSON-serializable value"""
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value, created_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, json.dumps(value), time.time()),
+                )
+
+                self._writes += 1
+                if self._writes % self.TRIM_INTERVAL == 0:
+                    self._trim(conn)
+        except sqlite3.Error as e:
+            print(f"Cache write error ({self.table}): {e}")
+
+    def _trim(self, conn):
+        """Delete expired rows, then the oldest rows beyond max_rows"""
+        if self.ttl:
+            conn.execute(
+                f"DELETE FROM {self.table} WHERE created_at < ?",
+                (time.time() - self.ttl,),
+            )
+        if self.max_rows:
+            conn.execute(
+                f"DELETE FROM {self.table} WHERE key IN ("
+                f"SELECT key FROM {self.table} ORDER BY created_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_rows,),
+            )
+
+    def count(self):
+        try:
+            with closing(self._connect()) as conn:
+                return conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        except sqlite3.Error:
+            return 0
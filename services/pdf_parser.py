@@ -1,6 +1,39 @@
 import PyPDF2
 import io
+import multiprocessing
 import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from config import Config
+
+_page_pool = None
+_page_pool_lock = threading.Lock()
+
+
+def _get_page_pool():
+    """Process pool shared by all parsers, created on first parallel extract"""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            # Spawned workers don't inherit the app's threads, locks or sockets
+            _page_pool = ProcessPoolExecutor(
+                max_workers=Config.PDF_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _page_pool
+
+
+def _extract_page_range(source, start, stop):
+    """Text of pages start..stop-1, run in a pool worker
+
+    Args:
+        source: PDF file path or raw bytes
+    """
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    pdf_reader = PyPDF2.PdfReader(source)
+    return [pdf_reader.pages[i].extract_text() or "" for i in range(start, stop)]
 
 
 class PDFParser:
@@ -9,22 +42,85 @@ class PDFParser:
     def __init__(self):
         self.supported_formats = [".pdf"]
 
+    def iter_pages(self, pdf):
+        """Yield the text of each page in order, up to Config.PDF_MAX_PAGES
+
+        Pages are extracted as they are consumed, so a caller that stops early
+        never pays for the rest of the document. Long PDFs are fanned out
+        across the process pool when Config.PDF_WORKERS is set.
+
+        Args:
+            pdf: File path or binary file-like object
+        """
+        pdf_reader = PyPDF2.PdfReader(pdf)
+        page_count = len(pdf_reader.pages)
+        if Config.PDF_MAX_PAGES:
+            page_count = min(page_count, Config.PDF_MAX_PAGES)
+
+        if Config.PDF_WORKERS > 1 and page_count >= Config.PDF_PARALLEL_MIN_PAGES:
+            if not isinstance(pdf, str):
+                pdf.seek(0)
+                pdf = pdf.read()
+            yield from self._iter_pages_parallel(pdf, page_count)
+            return
+
+        for page_num in range(page_count):
+            yield pdf_reader.pages[page_num].extract_text() or ""
+
+    def _iter_pages_parallel(self, source, page_count):
+        """Yield page texts from page ranges extracted in the process pool
+
+        Ranges are submitted a few at a time, so stopping early leaves the
+        remaining ranges unsubmitted.
+        """
+        workers = Config.PDF_WORKERS
+        step = -(-page_count // (workers * 2))
+        ranges = deque(
+            (start, min(start + step, page_count))
+            for start in range(0, page_count, step)
+        )
+        pool = _get_page_pool()
+        pending = deque()
+
+        try:
+            while ranges or pending:
+                while ranges and len(pending) < workers:
+                    start, stop = ranges.popleft()
+                    pending.append(
+                        pool.submit(_extract_page_range, source, start, stop)
+                    )
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def extract_text(self, pdf):
+        """Extract text up to Config.PDF_MAX_CHARS, joining pages once
+
+        Args:
+            pdf: File path or binary file-like object
+        """
+        pages = []
+        chars = 0
+        for page_text in self.iter_pages(pdf):
+            pages.append(page_text)
+            chars += len(page_text) + 1
+            # Text past the budget would be cut from the AI prompt anyway
+            if Config.PDF_MAX_CHARS and chars >= Config.PDF_MAX_CHARS:
+                break
+
+        text = "\n".join(pages).strip()
+        if Config.PDF_MAX_CHARS:
+            text = text[: Config.PDF_MAX_CHARS]
+        return text
+
     def extract_text_from_pdf(self, file_path):
         """Extract text content from a PDF file"""
         try:
             if not os.path.exists(file_path):
                 return "File not found"
 
-            text = ""
-            with open(file_path, "rb") as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-
-                # Extract text from all pages
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    text += page.extract_text() + "\n"
-
-            return text.strip()
+            return self.extract_text(file_path)
 
         except Exception as e:
             print(f"Error extracting text from PDF: {e}")
@@ -33,17 +129,8 @@ class PDFParser:
     def extract_text_from_file_object(self, file_object):
         """Extract text from a file object (uploaded file)"""
         try:
-            text = ""
             file_object.seek(0)  # Reset file pointer
-
-            pdf_reader = PyPDF2.PdfReader(file_object)
-
-            # Extract text from all pages
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                text += page.extract_text() + "\n"
-
-            return text.strip()
+            return self.extract_text(file_object)
 
         except Exception as e:
             print(f"Error extracting text from file object: {e}")
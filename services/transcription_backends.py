@@ -0,0 +1,148 @@
+# Speech-to-text engines behind a common interface for VoiceProcessor
+from config import Config
+
+
+class TranscriptionBackend:
+    """Loads models and transcribes 16 kHz mono float32 samples
+
+    Backends are interchangeable: VoiceProcessor picks the model name (tier
+    and language) and decode options, the backend runs them.
+    """
+
+    name = None
+
+    def __init__(self):
+        self.threads = 0  # 0 lets the engine decide
+
+    def configure_threads(self, threads, interop_threads=1):
+        """Limit the CPU threads this process uses for inference"""
+        self.threads = threads
+
+    def load(self, model_name):
+        """Load a model by Whisper name (e.g. "base", "small.en")"""
+        raise NotImplementedError
+
+    def device(self, model):
+        """Device the model runs on ("cpu" or "cuda")"""
+        return "cpu"
+
+    def transcribe(self, model, samples, language=None, prompt=None, options=None):
+        """Transcribe samples and return the stripped text
+
+        Args:
+            options (dict): Whisper decode options (see decode_options)
+        """
+        raise NotImplementedError
+
+
+class WhisperBackend(TranscriptionBackend):
+    """Reference openai-whisper implementation (PyTorch)"""
+
+    name = "whisper"
+
+    def configure_threads(self, threads, interop_threads=1):
+        import torch
+
+        self.threads = threads
+        torch.set_num_threads(threads)
+        try:
+            torch.set_num_interop_threads(interop_threads)
+        except RuntimeError as e:
+            # Only allowed once, before any inter-op parallel work has started
+            print(f"Could not set Torch inter-op threads: {e}")
+
+    def load(self, model_name):
+        import whisper
+
+        model = whisper.load_model(model_name)
+        if Config.WHISPER_QUANTIZE and model.device.type == "cpu":
+            model = quantize_linear_layers(model)
+        return model
+
+    def device(self, model):
+        return model.device.type
+
+    def transcribe(self, model, samples, language=None, prompt=None, options=None):
+        options = dict(options or {})
+        if prompt:
+            options["initial_prompt"] = prompt
+        if language:
+            options["language"] = language
+        return model.transcribe(samples, **options)["text"].strip()
+
+
+class FasterWhisperBackend(TranscriptionBackend):
+    """CTranslate2 implementation via faster-whisper
+
+    Runs the same Whisper weights converted for CTranslate2, quantized to
+    Config.FASTER_WHISPER_COMPUTE_TYPE (int8 by default) on CPU. Install
+    with `pip install faster-whisper`.
+    """
+
+    name = "faster-whisper"
+
+    def load(self, model_name):
+        from faster_whisper import WhisperModel
+
+        return WhisperModel(
+            model_name,
+            device=Config.FASTER_WHISPER_DEVICE,
+            compute_type=Config.FASTER_WHISPER_COMPUTE_TYPE,
+            cpu_threads=self.threads,
+        )
+
+    def device(self, model):
+        return Config.FASTER_WHISPER_DEVICE
+
+    def transcribe(self, model, samples, language=None, prompt=None, options=None):
+        options = dict(options or {})
+        # Precision is fixed by compute_type; greedy decoding is beam size 1
+        options.pop("fp16", None)
+        if options.get("beam_size") is None:
+            options["beam_size"] = 1
+        if options.get("best_of") is None:
+            options.pop("best_of", None)
+        temperature = options.get("temperature")
+        if isinstance(temperature, tuple):
+            options["temperature"] = list(temperature)
+
+        segments, _ = model.transcribe(
+            samples, language=language or None, initial_prompt=prompt, **options
+        )
+        # Segments are generated lazily as decoding proceeds
+        return "".join(segment.text for segment in segments).strip()
+
+
+def quantize_linear_layers(model):
+    """Dynamic int8 quantization of a Whisper model's linear layers for CPU
+
+    Weights are stored as int8 and activations quantized on the fly, which
+    shrinks the model and speeds up the matrix multiplies that dominate CPU
+    decoding.
+    """
+    import torch
+
+    # whisper.model.Linear only adds a dtype cast, a no-op in fp32, and
+    # quantize_dynamic only swaps exact nn.Linear modules
+    for module in model.modules():
+        if isinstance(module, torch.nn.Linear):
+            module.__class__ = torch.nn.Linear
+
+    return torch.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8
+    )
+
+
+BACKENDS = {
+    WhisperBackend.name: WhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend,
+}
+
+
+def get_backend(name=None):
+    """Backend instance by name, defaulting to Config.TRANSCRIPTION_BACKEND"""
+    name = name or Config.TRANSCRIPTION_BACKEND
+    if name not in BACKENDS:
+        print(f"Unknown transcription backend '{name}', using whisper")
+        name = WhisperBackend.name
+    return BACKENDS[name]()
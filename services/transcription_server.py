@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Shared Whisper transcription server
+
+Loads one Whisper model and serves transcription requests from every web
+worker over a Unix socket, instead of each gunicorn worker holding its own
+copy of the model. Run it alongside the app with:
+
+    TRANSCRIPTION_SERVER_SOCKET=/tmp/whisper.sock python -m services.transcription_server
+"""
+
+import math
+import os
+import queue
+import sys
+import threading
+import time
+from multiprocessing.connection import Listener
+import numpy as np
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from services.voice_processor import LatencyTracker, VoiceProcessor
+
+
+class TranscriptionServer:
+    """Owns the Whisper model and runs queued transcription requests
+
+    Clients decode audio themselves and send 16 kHz mono float32 PCM. Each
+    client connection is handled on its own thread. Transcriptions are
+    put on a queue and run one at a time by a single worker thread, so the
+    model never competes with itself for CPU. Once the queue is full, new
+    requests are answered as busy with a Retry-After estimate.
+    """
+
+    def __init__(self, address, authkey, processor=None):
+        self.address = address
+        self.authkey = authkey
+        self._queue = queue.Queue()
+        # Queued clips drive the processor's adaptive model tier choice
+        # The server is the only process running a model, so it uses every core
+        self.processor = processor or VoiceProcessor(
+            use_server=False, queue_depth=self._queue.qsize, processes=1
+        )
+        self._busy = False
+        self.latency = LatencyTracker()
+        self.wait = LatencyTracker()
+        self.rejected = 0
+
+    def serve_forever(self):
+        if os.path.exists(self.address):
+            os.unlink(self.address)
+
+        threading.Thread(target=self._work, daemon=True).start()
+
+        with Listener(self.address, family="AF_UNIX", authkey=self.authkey) as listener:
+            print(f"Transcription server listening on {self.address}")
+            while True:
+                try:
+                    conn = listener.accept()
+                except Exception as e:
+                    print(f"Transcription server accept error: {e}")
+                    continue
+                threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn):
+        """Serve requests from one client connection until it closes"""
+        with conn:
+            while True:
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError):
+                    return
+
+                if request.get("op") == "stats":
+                    conn.send(self.stats())
+                    continue
+
+                queued = self._queue.qsize()
+                if queued >= Config.TRANSCRIPTION_SERVER_MAX_QUEUED:
+                    self.rejected += 1
+                    retry_after = math.ceil(self.latency.percentile(95) * queued)
+                    conn.send({"busy": True, "retry_after": max(1, retry_after)})
+                    continue
+
+                job = {
+                    "request": request,
+                    "enqueued_at": time.perf_counter(),
+                    "done": threading.Event(),
+                }
+                self._queue.put(job)
+                job["done"].wait()
+
+                try:
+                    conn.send(job["result"])
+                except (EOFError, OSError):
+                    return
+
+    def _work(self):
+        """Run queued transcriptions one at a time on the shared model"""
+        while True:
+            job = self._queue.get()
+            request = job["request"]
+            started = time.perf_counter()
+            self._busy = True
+            self.wait.record(started - job["enqueued_at"])
+
+            try:
+                samples = np.frombuffer(request["pcm"], dtype=np.float32)
+                job["result"] = self.processor.transcribe_samples(
+                    samples,
+                    language=request.get("language"),
+                    prompt=request.get("prompt"),
+                )
+            except Exception as e:
+                print(f"Transcription server error: {e}")
+                job["result"] = {"error": str(e)}
+            finally:
+                self._busy = False
+                self.latency.record(time.perf_counter() - started)
+                job["done"].set()
+
+    def stats(self):
+        """Queue depth, per-clip latency and queue wait times"""
+        stats = {
+            "queue_depth": self._queue.qsize(),
+            "max_queued": Config.TRANSCRIPTION_SERVER_MAX_QUEUED,
+            "rejected": self.rejected,
+            "busy": self._busy,
+            "model_loaded": self.processor.model is not None,
+        }
+        stats.update(self.latency.stats())
+        stats.update(self.processor.tier_policy.stats())
+        stats["wait_avg"] = self.wait.stats()["latency_avg"]
+        return stats
+
+
+def main():
+    if not Config.TRANSCRIPTION_SERVER_SOCKET:
+        print("TRANSCRIPTION_SERVER_SOCKET is not set")
+        return False
+
+    server = TranscriptionServer(
+        Config.TRANSCRIPTION_SERVER_SOCKET, Config.TRANSCRIPTION_SERVER_AUTHKEY
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Transcription server stopped")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
@@ -0,0 +1,79 @@
+import hashlib
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from config import Config
+
+
+class UploadStore:
+    """Writes uploaded files to the upload folder on a background thread
+
+    Files are named by a hash of their content, so a re-uploaded file maps
+    to the same path and is only written once. save() returns the final path
+    straight away; the request never waits on the disk.
+    """
+
+    def __init__(self, folder=None, max_workers=1):
+        self.folder = folder or Config.UPLOAD_FOLDER
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="upload-store"
+        )
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.written = 0
+        self.deduplicated = 0
+        self.failed = 0
+
+    def path_for(self, data, prefix, extension):
+        """Content-addressed path for data, e.g. resume_<sha256>.pdf"""
+        digest = hashlib.sha256(data).hexdigest()
+        return os.path.join(self.folder, f"{prefix}_{digest}{extension}")
+
+    def save(self, data, prefix, extension):
+        """Queue data to be written and return the path it will have"""
+        path = self.path_for(data, prefix, extension)
+        with self._lock:
+            self.pending += 1
+        self._executor.submit(self._write, path, data)
+        return path
+
+    def _write(self, path, data):
+        temp_path = None
+        try:
+            if os.path.exists(path):
+                with self._lock:
+                    self.deduplicated += 1
+                return
+
+            os.makedirs(self.folder, exist_ok=True)
+            # Write then rename, so the file is never seen half-written
+            fd, temp_path = tempfile.mkstemp(dir=self.folder, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+            temp_path = None
+            with self._lock:
+                self.written += 1
+        except Exception as e:
+            print(f"Error storing upload {path}: {e}")
+            with self._lock:
+                self.failed += 1
+        finally:
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+            with self._lock:
+                self.pending -= 1
+
+    def stats(self):
+        """Write counts for this process"""
+        with self._lock:
+            return {
+                "pending": self.pending,
+                "written": self.written,
+                "deduplicated": self.deduplicated,
+                "failed": self.failed,
+            }
+
+
+upload_store = UploadStore()
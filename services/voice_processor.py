@@ -1,81 +1,1052 @@
-import whisper
 import soundfile as sf
+import numpy as np
+import hashlib
+import io
+import math
 import os
+import shutil
+import subprocess
 import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from multiprocessing.connection import Client
 from config import Config
+from services.cache import LRUCache, SQLiteCache
+from services.transcription_backends import get_backend
 
+# Whisper's expected sample rate
+SAMPLE_RATE = 16000
+
+
+@lru_cache(maxsize=16)
+def _polyphase_filter(up, down):
+    """Anti-aliasing FIR filter for rational resampling, split into phases
+
+    A Kaiser-windowed sinc low-pass at the tighter of the two Nyquist limits,
+    designed at the upsampled rate (the same design as SciPy's resample_poly).
+
+    Returns:
+        tuple: (phase matrix of shape (up, taps per phase), filter half length)
+    """
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    cutoff = 1.0 / max_rate  # Relative to the upsampled Nyquist frequency
+
+    n = np.arange(-half_len, half_len + 1, dtype=np.float64)
+    h = cutoff * np.sinc(cutoff * n) * np.kaiser(2 * half_len + 1, 5.0)
+    h *= up / h.sum()
+
+    # Row p holds the taps applied to input samples for output phase p
+    taps = -(-len(h) // up)
+    h = np.concatenate([h, np.zeros(taps * up - len(h))])
+    phases = h.reshape(taps, up).T.astype(np.float32)
+    phases.setflags(write=False)
+    return phases, half_len
+
+
+def resample(samples, orig_sr, target_sr=SAMPLE_RATE):
+    """Anti-aliased rational resampling of a 1-D float32 signal
+
+    Polyphase FIR implementation: only the filter taps that land on real input
+    samples are evaluated, so no zero-stuffed intermediate signal is built.
+    The loop runs once per tap per phase (tens of iterations), each one a
+    vectorized pass over the whole output.
+    """
+    if orig_sr == target_sr:
+        return samples
+
+    gcd = math.gcd(orig_sr, target_sr)
+    up, down = target_sr // gcd, orig_sr // gcd
+    phases, half_len = _polyphase_filter(up, down)
+    taps = phases.shape[1]
+
+    out_len = -(-len(samples) * up // down)
+    # Position of each output sample on the upsampled, delay-compensated grid
+    position = np.arange(out_len, dtype=np.int64) * down + half_len
+    phase = position % up
+    base = position // up + taps  # Offset for the zero padding below
+
+    padded = np.concatenate(
+        [
+            np.zeros(taps, dtype=np.float32),
+            np.asarray(samples, dtype=np.float32),
+            np.zeros(taps + 1, dtype=np.float32),
+        ]
+    )
+    base = np.minimum(base, len(padded) - 1)
+
+    output = np.zeros(out_len, dtype=np.float32)
+    for t in range(taps):
+        output += phases[phase, t] * padded[base - t]
+    return output
+
+
+# Containers libsndfile cannot read; these always go through ffmpeg
+FFMPEG_CONTAINERS = {"webm", "mp4"}
+
+
+def detect_container(head):
+    """Identify an audio container from its first bytes
+
+    Browsers label MediaRecorder output inconsistently, so the magic bytes are
+    trusted over the upload's file name and MIME type.
+
+    Returns:
+        str: "wav", "webm", "ogg", "flac", "mp4", "mp3", "aiff" or None
+    """
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return "wav"
+    if head[:4] == b"\x1a\x45\xdf\xa3":  # EBML header (WebM / Matroska)
+        return "webm"
+    if head[:4] == b"OggS":
+        return "ogg"
+    if head[:4] == b"fLaC":
+        return "flac"
+    if head[4:8] == b"ftyp":
+        return "mp4"
+    if head[:3] == b"ID3" or (len(head) > 1 and head[0] == 0xFF and head[1] >= 0xE0):
+        return "mp3"
+    if head[:4] == b"FORM" and head[8:12] in (b"AIFF", b"AIFC"):
+        return "aiff"
+    return None
+
+
+def sniff_container(audio):
+    """detect_container for a file path or seekable file-like object"""
+    if isinstance(audio, str):
+        with open(audio, "rb") as f:
+            return detect_container(f.read(16))
+
+    position = audio.tell()
+    try:
+        return detect_container(audio.read(16))
+    finally:
+        audio.seek(position)
+
+
+def ffmpeg_available():
+    return shutil.which(Config.FFMPEG_PATH) is not None
+
+
+def ffmpeg_decode(audio, max_seconds=None):
+    """Decode any ffmpeg-readable audio to 16 kHz mono float32 via pipes
+
+    Compressed bytes are written to ffmpeg's stdin and raw f32le samples read
+    back from its stdout, so no intermediate files are created. ffmpeg does
+    the downmix and resampling itself.
+
+    Args:
+        audio: File path or binary file-like object
+        max_seconds (float): Stop decoding after this much audio
+    """
+    command = [Config.FFMPEG_PATH, "-nostdin", "-hide_banner", "-loglevel", "error"]
+    if isinstance(audio, str):
+        command += ["-i", audio]
+        data = None
+    else:
+        command += ["-i", "pipe:0"]
+        data = audio.read()
+    if max_seconds:
+        command += ["-t", str(max_seconds)]
+    command += ["-f", "f32le", "-ac", "1", "-ar", str(SAMPLE_RATE), "pipe:1"]
+
+    process = subprocess.run(
+        command, input=data, capture_output=True, timeout=Config.FFMPEG_TIMEOUT
+    )
+    if process.returncode != 0:
+        message = process.stderr.decode("utf-8", "replace").strip()
+        raise RuntimeError(f"ffmpeg could not decode audio: {message[-200:]}")
+
+    return np.frombuffer(process.stdout, dtype=np.float32)
+
+
+def trim_silence(
+    samples, samplerate=SAMPLE_RATE, max_pause=0.6, padding=0.2, frame_ms=30
+):
+    """Drop edge silence and shorten long pauses using an energy / ZCR VAD
+
+    Frames are classed as speech when their energy is well above the
+    recording's noise floor, or moderately above it with a high zero-crossing
+    rate (unvoiced consonants such as "s" and "f"). Speech regions are padded
+    so word onsets and tails survive. Silence before the first and after the
+    last speech frame is removed, and internal pauses are cut to max_pause.
+
+    Args:
+        samples (np.ndarray): Mono float32 audio
+        samplerate (int): Sample rate of samples
+        max_pause (float): Longest internal pause to keep, in seconds
+        padding (float): Audio kept either side of speech, in seconds
+        frame_ms (int): Analysis frame length in milliseconds
+
+    Returns:
+        tuple: (trimmed samples, seconds of audio removed)
+    """
+    frame = int(samplerate * frame_ms / 1000)
+    n_frames = -(-len(samples) // frame)
+    if n_frames < 2:
+        return samples, 0.0
+
+    frames = np.zeros(n_frames * frame, dtype=np.float32)
+    frames[: len(samples)] = samples
+    frames = frames.reshape(n_frames, frame)
+
+    energy = np.mean(np.square(frames), axis=1)
+    signs = np.signbit(frames)
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / frame
+
+    # Adaptive threshold: ~12 dB over the noise floor, kept between an absolute
+    # floor (-50 dBFS) and 30 dB under the loudest frame
+    noise_floor = np.percentile(energy, 10)
+    threshold = np.clip(noise_floor * 16, 1e-5, max(1e-5, energy.max() * 1e-3))
+    speech = (energy > threshold) | ((energy > threshold / 4) & (zcr > 0.25))
+
+    if not speech.any():
+        return samples[:0], len(samples) / samplerate
+
+    # Extend speech by the padding on both sides
+    pad_frames = int(round(padding * 1000 / frame_ms))
+    if pad_frames:
+        kernel = np.ones(2 * pad_frames + 1)
+        speech = np.convolve(speech, kernel, mode="same") > 0
+
+    # Position of each silent frame within its run of silence
+    run_start = np.maximum.accumulate(np.where(speech, np.arange(n_frames), -1))
+    position_in_pause = np.arange(n_frames) - run_start - 1
+
+    pause_frames = int(round(max_pause * 1000 / frame_ms))
+    keep = speech | (position_in_pause < pause_frames)
+
+    # Drop leading and trailing silence entirely
+    voiced = np.flatnonzero(speech)
+    keep[: voiced[0]] = False
+    keep[voiced[-1] + 1 :] = False
+
+    mask = np.repeat(keep, frame)[: len(samples)]
+    trimmed = samples[mask]
+    return trimmed, (len(samples) - len(trimmed)) / samplerate
+
+
+# Lock file for this process's CPU block, held open for the life of the process
+_cpu_slot_lock = None
+
+
+def _pin_cpu_block(threads):
+    """Pin this process to the first free block of `threads` cores
+
+    Blocks are claimed with non-blocking file locks, so each worker process
+    gets its own and a restarted worker takes over the block its predecessor
+    held. Returns the cores pinned to, or None if no block is free.
+    """
+    global _cpu_slot_lock
+    import fcntl
+
+    cores = sorted(os.sched_getaffinity(0))
+    for slot in range(len(cores) // threads):
+        path = os.path.join(tempfile.gettempdir(), f"whisper-cpu-block-{slot}.lock")
+        handle = open(path, "w")
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            continue
+
+        _cpu_slot_lock = handle
+        block = cores[slot * threads : (slot + 1) * threads]
+        os.sched_setaffinity(0, block)
+        return block
+    return None
+
+
+def tune_cpu(backend, processes):
+    """Apply thread and CPU affinity settings for inference in this process
+
+    By default the available cores are split evenly between the processes
+    that run a model, so gunicorn workers do not oversubscribe the CPU.
+
+    Args:
+        backend (TranscriptionBackend): Backend whose threads to configure
+        processes (int): Number of processes running a model on this host
+
+    Returns:
+        dict: The effective settings
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    threads = Config.WHISPER_CPU_THREADS or max(1, cpus // max(1, processes))
+    threads = min(threads, cpus)
+
+    affinity = None
+    if Config.WHISPER_CPU_AFFINITY:
+        try:
+            affinity = _pin_cpu_block(threads)
+            if affinity is None:
+                print("No free CPU block to pin to; running unpinned")
+        except (AttributeError, ImportError, OSError) as e:
+            print(f"CPU affinity not supported here: {e}")
+
+    try:
+        backend.configure_threads(threads, Config.WHISPER_INTEROP_THREADS)
+    except Exception as e:
+        print(f"Could not configure inference threads: {e}")
+
+    return {
+        "threads": threads,
+        "interop_threads": Config.WHISPER_INTEROP_THREADS,
+        "affinity": affinity,
+        "quantize": Config.WHISPER_QUANTIZE,
+    }
+
+
+# Failure reasons for clips that need a specific response
+NO_SPEECH = "no_speech"
+TOO_LONG = "too_long"
+
+
+def _failure(message, reason="failed", model=None):
+    """Transcription result for a clip that produced no transcript
+
+    The "failure" key marks the text as a message rather than speech, so
+    callers never have to guess from the wording. Successful results have no
+    "failure" key.
+    """
+    return {"text": message, "model": model, "failure": reason}
+
+
+class LatencyTracker:
+    """Rolling window of per-clip processing times"""
+
+    def __init__(self, window=200):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def record(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+            self.count += 1
+
+    def percentile(self, pct):
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return 0.0
+        index = min(len(samples) - 1, int(round(pct / 100 * (len(samples) - 1))))
+        return samples[index]
+
+    def stats(self):
+        with self._lock:
+            samples = list(self._samples)
+            count = self.count
+        return {
+            "clips": count,
+            "latency_last": round(samples[-1], 3) if samples else 0.0,
+            "latency_avg": round(sum(samples) / len(samples), 3) if samples else 0.0,
+            "latency_p95": round(self.percentile(95), 3),
+        }
+
+
+class TranscriptionBusy(Exception):
+    """Transcription capacity is exhausted; the caller should retry later"""
+
+    def __init__(self, retry_after):
+        super().__init__(f"Transcription busy, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class AdmissionLimiter:
+    """Bounds concurrent transcriptions and the queue waiting for them
+
+    Up to max_concurrent callers run at once; up to max_queued more wait for a
+    slot for at most timeout seconds. Anyone beyond that, or still waiting at
+    the timeout, gets TranscriptionBusy straight away instead of slowing every
+    other request down.
+    """
+
+    def __init__(self, max_concurrent, max_queued, timeout, latency=None):
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queued = max(0, max_queued)
+        self.timeout = timeout
+        self.latency = latency
+        self._slots = threading.BoundedSemaphore(self.max_concurrent)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.queued = 0
+        self.rejected = 0
+
+    def retry_after(self):
+        """Seconds until a slot is likely to be free, from recent latency"""
+        p95 = self.latency.percentile(95) if self.latency else 0.0
+        with self._lock:
+            waiting = self.queued + 1
+        return max(1, math.ceil(p95 * waiting / self.max_concurrent))
+
+    def _reject(self):
+        with self._lock:
+            self.rejected += 1
+        raise TranscriptionBusy(self.retry_after())
+
+    @contextmanager
+    def slot(self):
+        with self._lock:
+            full = self.in_flight + self.queued >= self.max_concurrent + self.max_queued
+            if not full:
+                self.queued += 1
+        if full:
+            self._reject()
+
+        acquired = self._slots.acquire(timeout=self.timeout)
+        with self._lock:
+            self.queued -= 1
+            if acquired:
+                self.in_flight += 1
+        if not acquired:
+            self._reject()
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+            self._slots.release()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "in_flight": self.in_flight,
+                "queued": self.queued,
+                "rejected": self.rejected,
+                "max_concurrent": self.max_concurrent,
+                "max_queued": self.max_queued,
+            }
+
+
+# Whisper decode options per model tier. The fastest tier serves clips under
+# load, so it decodes greedily without the temperature fallback; the largest
+# uses beam search.
+DECODE_PROFILES = {
+    "tiny": {"temperature": 0.0, "beam_size": None, "best_of": None},
+    "base": {
+        "temperature": (0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+        "beam_size": None,
+        "best_of": 5,
+    },
+    "small": {
+        "temperature": (0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+        "beam_size": 5,
+        "best_of": 5,
+    },
+}
+
+
+def decode_options(model_name, device="cpu"):
+    """Decode options for a model; fp16 only helps on a GPU"""
+    tier = model_name.split(".")[0]
+    options = dict(DECODE_PROFILES.get(tier, DECODE_PROFILES["base"]))
+    options["fp16"] = device == "cuda"
+    return options
+
+
+class ModelTierPolicy:
+    """Chooses the Whisper model tier for each clip from the current load
+
+    Load is measured as the real-time factor of each clip: processing time
+    divided by audio duration, so long answers don't look like a slow model.
+    Whisper pads audio to 30 s windows, so shorter clips count as one window.
+
+    Steps down one tier when the transcription queue is deep or recent p95
+    real-time factor crosses the threshold, and back up once the queue is
+    empty and p95 is under half the threshold. Changes are at least
+    `cooldown` seconds apart, and the window restarts after each change so
+    it measures the tier now in use.
+    """
+
+    # Whisper's input window; shorter clips cost a full window
+    WINDOW_SECONDS = 30.0
+
+    def __init__(
+        self,
+        tiers,
+        preferred,
+        adaptive=True,
+        queue_threshold=2,
+        rtf_threshold=0.5,
+        cooldown=30.0,
+        window=20,
+    ):
+        # Tiers larger than the preferred model are never used
+        if preferred in tiers:
+            tiers = list(tiers[: tiers.index(preferred) + 1])
+        else:
+            tiers = [preferred]
+
+        self.tiers = tiers
+        self.adaptive = adaptive
+        self.queue_threshold = queue_threshold
+        self.rtf_threshold = rtf_threshold
+        self.cooldown = cooldown
+        self.window = window
+        self.rtf = LatencyTracker(window)
+        self.changes = 0
+        self._index = len(tiers) - 1
+        self._changed_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def current(self):
+        return self.tiers[self._index]
+
+    def record(self, seconds, audio_seconds):
+        """Record the processing time of a clip of audio_seconds"""
+        self.rtf.record(seconds / max(audio_seconds, self.WINDOW_SECONDS))
+
+    def select(self, queue_depth):
+        """Tier to use for the next clip, given how many clips are waiting"""
+        if not self.adaptive or len(self.tiers) == 1:
+            return self.current
+
+        with self._lock:
+            if time.monotonic() - self._changed_at >= self.cooldown:
+                p95 = self.rtf.percentile(95)
+                overloaded = (
+                    queue_depth >= self.queue_threshold or p95 >= self.rtf_threshold
+                )
+                idle = queue_depth == 0 and p95 < self.rtf_threshold / 2
+
+                if overloaded and self._index > 0:
+                    self._step(-1, queue_depth, p95)
+                elif idle and self._index < len(self.tiers) - 1:
+                    self._step(1, queue_depth, p95)
+
+            return self.current
+
+    def _step(self, direction, queue_depth, p95):
+        self._index += direction
+        self._changed_at = time.monotonic()
+        self.rtf = LatencyTracker(self.window)
+        self.changes += 1
+        print(
+            f"Whisper model tier -> {self.current} "
+            f"(queue depth {queue_depth}, p95 real-time factor {p95:.2f})"
+        )
+
+    def stats(self):
+        return {
+            "tier": self.current,
+            "tiers": self.tiers,
+            "tier_changes": self.changes,
+            "tier_rtf_p95": round(self.rtf.percentile(95), 3),
+        }
+
+
+class TranscriptCache:
+    """Transcripts keyed by a hash of the uploaded audio
+
+    Client retries resubmit byte-identical audio, so the raw upload is hashed
+    together with the language, the prompt and the Whisper model. Entries are
+    stored under the model that actually produced them, so a transcript from
+    a stepped-down or fallback model is never served as the preferred one.
+    A hit skips decoding and Whisper entirely.
+    An in-memory LRU sits in front of an optional SQLite table shared by
+    every worker process.
+    """
 
-class VoiceProcessor:
     def __init__(self):
-        """Initialize the voice processor with Whisper model"""
+        self.enabled = Config.TRANSCRIPT_CACHE_ENABLED
+        self.memory = LRUCache(
+            maxsize=Config.TRANSCRIPT_CACHE_SIZE, ttl=Config.TRANSCRIPT_CACHE_TTL
+        )
+        self.store = (
+            SQLiteCache(
+                Config.CACHE_DB_PATH,
+                "transcripts",
+                ttl=Config.TRANSCRIPT_CACHE_TTL,
+                max_rows=Config.TRANSCRIPT_CACHE_MAX_ROWS,
+            )
+            if Config.TRANSCRIPT_CACHE_PERSIST
+            else None
+        )
+        self._lock = threading.Lock()
+        self.store_hits = 0
+        self.misses = 0
+
+    # Bumped when the cached result format changes, orphaning old rows
+    KEY_VERSION = 2
+
+    @classmethod
+    def make_key(cls, audio_bytes, language, prompt, model):
+        digest = hashlib.sha256(audio_bytes)
+        digest.update(f"\0{language or ''}\0{prompt or ''}".encode("utf-8"))
+        return f"v{cls.KEY_VERSION}:{model}:{digest.hexdigest()}"
+
+    def get(self, key):
+        """Return the cached transcription result, or None on a miss"""
+        if not self.enabled:
+            return None
+
+        result = self.memory.get(key)
+        if result is not None:
+            return result
+
+        result = self.store.get(key) if self.store else None
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                return None
+            self.store_hits += 1
+
+        # Promote to memory for subsequent lookups
+        self.memory.set(key, result)
+        return result
+
+    def set(self, key, result):
+        if not self.enabled:
+            return
+
+        self.memory.set(key, result)
+        if self.store:
+            self.store.set(key, result)
+
+    def stats(self):
+        """Return memory/store hit counters and the overall hit ratio"""
+        memory_stats = self.memory.stats()
+        with self._lock:
+            hits = memory_stats["hits"] + self.store_hits
+            lookups = hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "persistent": self.store is not None,
+                "memory": memory_stats,
+                "store_hits": self.store_hits,
+                "misses": self.misses,
+                "hit_ratio": round(hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+class VoiceProcessor:
+    def __init__(self, use_server=None, queue_depth=None, backend=None, processes=None):
+        """Initialize the voice processor with Whisper model
+
+        Args:
+            use_server (bool): Send transcriptions to the shared transcription
+                server instead of loading a model in this process. Defaults to
+                whether Config.TRANSCRIPTION_SERVER_SOCKET is set.
+            queue_depth (callable): Returns how many clips are waiting for this
+                processor. Defaults to the admission queue length.
+            backend (TranscriptionBackend): Speech-to-text engine, defaults to
+                Config.TRANSCRIPTION_BACKEND
+            processes (int): Processes on this host running a model, used to
+                share out CPU threads. Defaults to Config.WEB_CONCURRENCY.
+        """
+        if use_server is None:
+            use_server = bool(Config.TRANSCRIPTION_SERVER_SOCKET)
+
+        self.use_server = use_server
+        self.backend = backend or get_backend()
+        self.latency = LatencyTracker()
+        self.model = None
+        self.default_model_name = None
+        self._models = {}
+        self._model_lock = threading.Lock()
+        self._audio_lock = threading.Lock()
+        self.audio_seconds = 0.0
+        self.silence_removed = 0.0
+        self.queue_depth = queue_depth
+        self.cpu_settings = None
+        self.transcript_cache = TranscriptCache()
+        self.limiter = AdmissionLimiter(
+            Config.WHISPER_MAX_CONCURRENT,
+            Config.WHISPER_MAX_QUEUED,
+            Config.WHISPER_QUEUE_TIMEOUT,
+            latency=self.latency,
+        )
+        self.clips_by_model = {}
+        self.tier_policy = ModelTierPolicy(
+            Config.WHISPER_MODEL_TIERS,
+            Config.WHISPER_MODEL,
+            adaptive=Config.WHISPER_ADAPTIVE_TIERS,
+            queue_threshold=Config.WHISPER_TIER_QUEUE_THRESHOLD,
+            rtf_threshold=Config.WHISPER_TIER_RTF_THRESHOLD,
+            cooldown=Config.WHISPER_TIER_COOLDOWN,
+        )
+
+        if self.use_server:
+            print(
+                f"Using shared transcription server at {Config.TRANSCRIPTION_SERVER_SOCKET}"
+            )
+            return
+
+        self.cpu_settings = tune_cpu(self.backend, processes or Config.WEB_CONCURRENCY)
+        print(
+            f"Whisper CPU settings: backend={self.backend.name}, "
+            f"threads={self.cpu_settings['threads']}, "
+            f"interop_threads={self.cpu_settings['interop_threads']}, "
+            f"affinity={self.cpu_settings['affinity'] or 'none'}, "
+            f"int8_linear={self.cpu_settings['quantize']}"
+        )
+
+        # The preferred tier for the default language is loaded up front; other
+        # tiers and languages load on first use
+        self.default_model_name = self.model_name(
+            Config.WHISPER_MODEL, Config.DEFAULT_LANGUAGE
+        )
+        self.model = self._get_model(self.default_model_name)
+        if self.model is None and self.default_model_name != Config.WHISPER_MODEL:
+            self.default_model_name = Config.WHISPER_MODEL
+            self.model = self._get_model(self.default_model_name)
+
+    def model_name(self, tier, language):
+        """Whisper model for a tier and interview language
+
+        Config.WHISPER_MODEL_BY_LANGUAGE maps languages to name templates,
+        e.g. "{tier}.en" for English-only models. Other languages, and
+        auto-detection, use the multilingual model.
+        """
+        template = Config.WHISPER_MODEL_BY_LANGUAGE.get(language or "", "{tier}")
+        return template.format(tier=tier)
+
+    def _get_model(self, name):
+        """Load a Whisper model on first use and cache it by name
+
+        Failed loads are cached as None so they are not retried per clip.
+        """
+        with self._model_lock:
+            if name not in self._models:
+                try:
+                    self._models[name] = self.backend.load(name)
+                    print(
+                        f"Whisper model '{name}' loaded successfully "
+                        f"({self.backend.name} backend)"
+                    )
+                except Exception as e:
+                    print(f"Error loading Whisper model '{name}': {e}")
+                    self._models[name] = None
+            return self._models[name]
+
+    def speech_to_text(self, audio, language="en", prompt=None):
+        """Convert speech audio to text
+
+        Args:
+            audio: Path to the audio file, raw file bytes or a binary file-like
+                object (e.g. an uploaded file's stream)
+            language (str): Language code for transcription (e.g., 'en', 'vi')
+            prompt (str): Preceding transcript, passed to Whisper as
+                initial_prompt so consecutive segments read continuously
+        """
+        return self.transcribe(audio, language, prompt)["text"]
+
+    def transcribe(self, audio, language="en", prompt=None):
+        """Convert speech audio to text, reporting which model was used
+
+        Takes the same arguments as speech_to_text.
+
+        Returns:
+            dict: {"text": transcript or error message,
+                   "model": Whisper model that served the clip, or None}
+
+        Raises:
+            TranscriptionBusy: Too many clips are already being transcribed
+        """
+        if not self.use_server and not self.model:
+            return _failure(
+                "Audio transcription unavailable - model not loaded", "unavailable"
+            )
+
         try:
-            # Use base model for better performance vs accuracy trade-off
-            self.model = whisper.load_model("base")
-            print("Whisper model loaded successfully")
+            # Check if file exists
+            if isinstance(audio, str) and not os.path.exists(audio):
+                return _failure("Audio file not found", "not_found")
+
+            audio_bytes = self._read_bytes(audio)
+
+            # Duplicate submissions are answered without decoding, if the
+            # model serving this language at the current tier transcribed them
+            cached = self.transcript_cache.get(
+                self.transcript_cache.make_key(
+                    audio_bytes,
+                    language,
+                    prompt,
+                    self.model_name(self.tier_policy.current, language),
+                )
+            )
+            if cached is not None:
+                return cached
+
+            audio = io.BytesIO(audio_bytes)
+
+            # Reject long clips from the header, before decoding anything
+            if self.exceeds_max_duration(audio):
+                return _failure(
+                    f"Audio too long: answers are limited to "
+                    f"{Config.MAX_ANSWER_SECONDS:.0f} seconds",
+                    TOO_LONG,
+                )
         except Exception as e:
-            print(f"Error loading Whisper model: {e}")
-            self.model = None
+            print(f"Audio decoding error: {e}")
+            return _failure(f"Transcription failed: {str(e)}")
+
+        # Decoding and inference both hold an admission slot
+        with self.limiter.slot():
+            try:
+                samples = self.load_audio(audio)
+
+                # Compressed uploads have no duration in a header soundfile can read
+                if (
+                    Config.MAX_ANSWER_SECONDS
+                    and len(samples) > Config.MAX_ANSWER_SECONDS * SAMPLE_RATE
+                ):
+                    return _failure(
+                        f"Audio too long: answers are limited to "
+                        f"{Config.MAX_ANSWER_SECONDS:.0f} seconds",
+                        TOO_LONG,
+                    )
+
+                samples = self.trim_silence(samples)
+            except Exception as e:
+                print(f"Audio decoding error: {e}")
+                return _failure(f"Transcription failed: {str(e)}")
+
+            if not len(samples):
+                return _failure("Could not transcribe audio", NO_SPEECH)
 
-    def speech_to_text(self, audio_path, language="en"):
-        """Convert speech audio file to text
+            result = self.transcribe_samples(samples, language, prompt)
+
+        if "failure" not in result:
+            cache_key = self.transcript_cache.make_key(
+                audio_bytes, language, prompt, result["model"]
+            )
+            self.transcript_cache.set(cache_key, result)
+        return result
+
+    def _read_bytes(self, audio):
+        """Raw bytes of a file path, bytes or binary file-like object"""
+        if isinstance(audio, (bytes, bytearray)):
+            return bytes(audio)
+        if isinstance(audio, str):
+            with open(audio, "rb") as f:
+                return f.read()
+        return audio.read()
+
+    @staticmethod
+    def load_audio(audio):
+        """Decode audio once into a 16 kHz mono float32 NumPy array
+
+        WAV, FLAC, Ogg and similar are read with soundfile. WebM/Opus and MP4
+        browser recordings, and anything else soundfile cannot read, are
+        piped through ffmpeg.
 
         Args:
-            audio_path (str): Path to the audio file
-            language (str): Language code for transcription (e.g., 'en', 'vi')
+            audio: File path, raw bytes or a seekable binary file-like object
+        """
+        if isinstance(audio, (bytes, bytearray)):
+            audio = io.BytesIO(audio)
+
+        # Decode at most one second past the answer limit
+        max_seconds = (
+            Config.MAX_ANSWER_SECONDS + 1 if Config.MAX_ANSWER_SECONDS else None
+        )
+
+        if sniff_container(audio) in FFMPEG_CONTAINERS:
+            return ffmpeg_decode(audio, max_seconds)
+
+        position = None if isinstance(audio, str) else audio.tell()
+        try:
+            data, samplerate = sf.read(audio, dtype="float32")
+        except Exception as e:
+            if not ffmpeg_available():
+                raise
+            print(f"soundfile could not read audio, trying ffmpeg: {e}")
+            if position is not None:
+                audio.seek(position)
+            return ffmpeg_decode(audio, max_seconds)
+
+        # Convert to mono if stereo
+        if data.ndim > 1:
+            data = data.mean(axis=1)
+
+        # Resample to 16kHz if needed (Whisper's expected sample rate)
+        data = resample(data, samplerate, SAMPLE_RATE)
+
+        return np.ascontiguousarray(data, dtype=np.float32)
+
+    def trim_silence(self, samples):
+        """Remove silence before transcription and record how much was cut"""
+        if not Config.VAD_ENABLED:
+            return samples
+
+        trimmed, removed = trim_silence(
+            samples,
+            SAMPLE_RATE,
+            max_pause=Config.VAD_MAX_PAUSE,
+            padding=Config.VAD_PADDING,
+        )
+
+        with self._audio_lock:
+            self.audio_seconds += len(samples) / SAMPLE_RATE
+            self.silence_removed += removed
+
+        if removed:
+            print(
+                f"Trimmed {removed:.1f}s of silence from "
+                f"{len(samples) / SAMPLE_RATE:.1f}s answer audio"
+            )
+        return trimmed
+
+    def transcribe_samples(self, samples, language="en", prompt=None):
+        """Transcribe 16 kHz mono float32 samples
+
+        Runs the local model, or sends the samples to the shared
+        transcription server when this processor is a client of it.
+
+        Returns:
+            dict: {"text": ..., "model": ...} as returned by transcribe
         """
+        if self.use_server:
+            return self._transcribe_remote(samples, language, prompt)
+
         if not self.model:
-            return "Audio transcription unavailable - model not loaded"
+            return _failure(
+                "Audio transcription unavailable - model not loaded", "unavailable"
+            )
 
         try:
-            # Check if file exists
-            if not os.path.exists(audio_path):
-                return "Audio file not found"
-
-            # Load and process audio
-            data, samplerate = sf.read(audio_path)
-
-            # Convert to mono if stereo
-            if len(data.shape) > 1:
-                data = data.mean(axis=1)
-
-            # Resample to 16kHz if needed (Whisper's expected sample rate)
-            if samplerate != 16000:
-                # Create temporary file with correct sample rate
-                with tempfile.NamedTemporaryFile(
-                    suffix=".wav", delete=False
-                ) as temp_file:
-                    temp_path = temp_file.name
-                    # Simple resampling (for production, consider using librosa)
-                    step = samplerate // 16000
-                    resampled_data = data[::step] if step > 1 else data
-                    sf.write(temp_path, resampled_data, 16000)
-                    audio_path = temp_path
+            queue_depth = (
+                self.queue_depth() if self.queue_depth else self.limiter.queued
+            )
+            tier = self.tier_policy.select(queue_depth)
+            model_name = self.model_name(tier, language)
+            model = self._get_model(model_name)
+
+            # Fall back to the multilingual model for the tier, then the
+            # model loaded at startup
+            if model is None and model_name != tier:
+                model_name, model = tier, self._get_model(tier)
+            if model is None:
+                model_name, model = self.default_model_name, self.model
+
+            started = time.perf_counter()
 
             # Transcribe audio with specified language
             # If language is None or empty, let Whisper auto-detect
-            if language and language.strip():
-                result = self.model.transcribe(audio_path, language=language)
-            else:
-                result = self.model.transcribe(audio_path)
-            transcribed_text = result["text"].strip()
-
-            # Clean up temporary file if created
-            if samplerate != 16000 and os.path.exists(temp_path):
-                os.unlink(temp_path)
-
-            return (
-                transcribed_text if transcribed_text else "Could not transcribe audio"
+            options = decode_options(model_name, self.backend.device(model))
+            transcribed_text = self.backend.transcribe(
+                model,
+                samples,
+                language=language.strip() if language else None,
+                prompt=prompt,
+                options=options,
             )
 
+            elapsed = time.perf_counter() - started
+            self.latency.record(elapsed)
+            self.tier_policy.record(elapsed, len(samples) / SAMPLE_RATE)
+            with self._audio_lock:
+                self.clips_by_model[model_name] = (
+                    self.clips_by_model.get(model_name, 0) + 1
+                )
+
+            if not transcribed_text:
+                return _failure("Could not transcribe audio", NO_SPEECH, model_name)
+            return {"text": transcribed_text, "model": model_name}
+
         except Exception as e:
             print(f"Transcription error: {e}")
-            return f"Transcription failed: {str(e)}"
+            return _failure(f"Transcription failed: {str(e)}")
+
+    def _transcribe_remote(self, samples, language, prompt=None):
+        """Send decoded samples to the shared transcription server"""
+        started = time.perf_counter()
+        try:
+            response = self._server_request(
+                {
+                    "op": "transcribe",
+                    "pcm": samples.tobytes(),
+                    "language": language,
+                    "prompt": prompt,
+                }
+            )
+        except Exception as e:
+            print(f"Transcription server error: {e}")
+            return _failure(f"Transcription failed: {str(e)}")
+
+        if response.get("busy"):
+            raise TranscriptionBusy(response["retry_after"])
+        self.latency.record(time.perf_counter() - started)
+        if "error" in response:
+            return _failure(f"Transcription failed: {response['error']}")
+        return response
+
+    def _server_request(self, request):
+        """Send one request to the transcription server and wait for its reply"""
+        with Client(
+            Config.TRANSCRIPTION_SERVER_SOCKET,
+            family="AF_UNIX",
+            authkey=Config.TRANSCRIPTION_SERVER_AUTHKEY,
+        ) as conn:
+            conn.send(request)
+            if not conn.poll(Config.TRANSCRIPTION_SERVER_TIMEOUT):
+                raise TimeoutError("transcription server did not respond in time")
+            return conn.recv()
+
+    def stats(self):
+        """Per-clip latency seen by this process, plus server queue stats"""
+        stats = {
+            "mode": "server" if self.use_server else "local",
+            "backend": None if self.use_server else self.backend.name,
+        }
+        stats.update(self.latency.stats())
+        with self._audio_lock:
+            stats["audio_seconds"] = round(self.audio_seconds, 1)
+            stats["silence_removed_seconds"] = round(self.silence_removed, 1)
+            stats["clips_by_model"] = dict(self.clips_by_model)
+        stats["transcript_cache"] = self.transcript_cache.stats()
+        stats["admission"] = self.limiter.stats()
+        if self.cpu_settings:
+            stats["cpu"] = self.cpu_settings
+
+        if not self.use_server:
+            stats.update(self.tier_policy.stats())
+            with self._model_lock:
+                stats["models_loaded"] = sorted(
+                    name for name, model in self._models.items() if model is not None
+                )
+
+        if self.use_server:
+            try:
+                stats["server"] = self._server_request({"op": "stats"})
+            except Exception as e:
+                stats["server"] = {"error": str(e)}
+        return stats
+
+    def audio_info(self, audio):
+        """Read audio metadata from the file header without decoding samples
+
+        Args:
+            audio: File path, raw bytes or a seekable binary file-like object.
+                A file-like object is returned to its original position.
+        """
+        if isinstance(audio, (bytes, bytearray)):
+            audio = io.BytesIO(audio)
+
+        if isinstance(audio, str):
+            return sf.info(audio)
+
+        position = audio.tell()
+        try:
+            return sf.info(audio)
+        finally:
+            audio.seek(position)
 
     def validate_audio_file(self, file_path):
         """Validate if the audio file is readable"""
         try:
-            data, samplerate = sf.read(file_path)
-            return len(data) > 0 and samplerate > 0
+            info = self.audio_info(file_path)
+            return info.frames > 0 and info.samplerate > 0
         except Exception as e:
             print(f"Audio validation error: {e}")
             return False
@@ -83,12 +1054,26 @@ class VoiceProcessor:
     def get_audio_duration(self, file_path):
         """Get duration of audio file in seconds"""
         try:
-            data, samplerate = sf.read(file_path)
-            return len(data) / samplerate
+            info = self.audio_info(file_path)
+            return info.frames / info.samplerate
         except Exception as e:
             print(f"Error getting audio duration: {e}")
             return 0
 
+    def exceeds_max_duration(self, audio):
+        """Whether the clip is longer than Config.MAX_ANSWER_SECONDS
+
+        Clips whose header cannot be read are let through; compressed browser
+        recordings are checked after decoding instead.
+        """
+        if not Config.MAX_ANSWER_SECONDS:
+            return False
+        if isinstance(audio, (bytes, bytearray)):
+            audio = io.BytesIO(audio)
+        if sniff_container(audio) in FFMPEG_CONTAINERS:
+            return False
+        return self.get_audio_duration(audio) > Config.MAX_ANSWER_SECONDS
+
     def text_to_speech_placeholder(self, text):
         """Placeholder for text-to-speech functionality"""
         # This could be implemented with a TTS service like gTTS or Azure Speech
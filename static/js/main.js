@@ -10,6 +10,24 @@ let currentQuestionIndex = 0;
 let isRecording = false;
 let isLoggedIn = false;
 let selectedLanguage = "en"; // Default language
+let liveTranscription = null; // Segment recorder state while recording
+
+// Live transcription segments are cut in a pause once they are at least
+// LIVE_SEGMENT_MS long, so no word is split between two segments. A segment
+// with no pause by LIVE_SEGMENT_MAX_MS is cut anyway.
+const LIVE_SEGMENT_MS = 5000;
+const LIVE_SEGMENT_MAX_MS = 15000;
+// Input level (RMS) below which the microphone counts as silent, and how
+// long it has to stay there to count as a pause
+const LIVE_SILENCE_RMS = 0.01;
+const LIVE_PAUSE_MS = 300;
+const LIVE_LEVEL_POLL_MS = 50;
+
+// Preferred recording format: compact Opus, decoded on the server by ffmpeg
+const RECORDING_MIME_TYPES = ["audio/webm;codecs=opus", "audio/ogg;codecs=opus"];
+// Mono speech bitrate, well above what transcription needs
+const RECORDING_BITS_PER_SECOND = 24000;
+const MICROPHONE_CONSTRAINTS = { audio: { channelCount: 1 } };
 
 // API base URL
 const API_BASE = window.location.origin + "/api";
@@ -613,8 +631,11 @@ function clearAnswerInputs() {
   // Reset recording state
   isRecording = false;
   audioChunks = [];
+  liveTranscription = null;
   window.currentAudioBlob = null;
   window.currentAudioFile = null;
+  window.liveTranscriptPromise = null;
+  showLiveTranscript("");
   updateRecordButton();
 }
 
@@ -696,11 +717,30 @@ async function toggleRecording() {
   }
 }
 
+// MediaRecorder using the first supported compact format
+function createRecorder(stream) {
+  const mimeType = RECORDING_MIME_TYPES.find((type) =>
+    MediaRecorder.isTypeSupported(type),
+  );
+  const options = { audioBitsPerSecond: RECORDING_BITS_PER_SECOND };
+  if (mimeType) options.mimeType = mimeType;
+  return new MediaRecorder(stream, options);
+}
+
+// Upload file name matching a recording's actual container
+function recordingFileName(blob, name) {
+  const type = blob.type || "";
+  if (type.includes("ogg")) return `${name}.ogg`;
+  if (type.includes("mp4")) return `${name}.m4a`;
+  if (type.includes("wav")) return `${name}.wav`;
+  return `${name}.webm`;
+}
+
 // Start recording
 async function startRecording() {
   try {
-    const stream = await navigator.mediaDevices.getUserMedia({ audio: true });
-    mediaRecorder = new MediaRecorder(stream);
+    const stream = await navigator.mediaDevices.getUserMedia(MICROPHONE_CONSTRAINTS);
+    mediaRecorder = createRecorder(stream);
     audioChunks = [];
 
     mediaRecorder.ondataavailable = (event) => {
@@ -708,7 +748,7 @@ async function startRecording() {
     };
 
     mediaRecorder.onstop = () => {
-      const audioBlob = new Blob(audioChunks, { type: "audio/wav" });
+      const audioBlob = new Blob(audioChunks, { type: mediaRecorder.mimeType });
       // Store the blob for submission
       window.currentAudioBlob = audioBlob;
 
@@ -721,6 +761,7 @@ async function startRecording() {
     };
 
     mediaRecorder.start();
+    startLiveTranscription(stream);
     isRecording = true;
     updateRecordButton();
 
@@ -739,6 +780,7 @@ async function startRecording() {
 function stopRecording() {
   if (mediaRecorder && isRecording) {
     mediaRecorder.stop();
+    window.liveTranscriptPromise = finishLiveTranscription();
     isRecording = false;
     updateRecordButton();
 
@@ -754,6 +796,173 @@ function stopRecording() {
   }
 }
 
+// Transcribe the answer while it is being recorded. A second recorder on the
+// same stream is restarted every LIVE_SEGMENT_MS so each segment is a
+// standalone file the server can decode. The full recording is still kept for
+// playback and as a fallback if live transcription fails.
+function startLiveTranscription(stream) {
+  // The input level decides where segments are cut
+  let audioContext;
+  let analyser;
+  try {
+    audioContext = new AudioContext();
+    analyser = audioContext.createAnalyser();
+    analyser.fftSize = 1024;
+    audioContext.createMediaStreamSource(stream).connect(analyser);
+  } catch (error) {
+    console.warn("Live transcription unavailable:", error);
+    liveTranscription = null;
+    return;
+  }
+
+  const live = {
+    texts: [],
+    models: new Set(),
+    pending: Promise.resolve(),
+    failed: false,
+    forcedCut: false,
+    stopped: false,
+    recorder: null,
+    openSegments: 0,
+    segmentStarted: 0,
+    silentSince: null,
+    audioContext,
+    poller: null,
+    onFinished: null,
+  };
+  liveTranscription = live;
+
+  const recordSegment = () => {
+    const recorder = createRecorder(stream);
+    const chunks = [];
+
+    recorder.ondataavailable = (event) => chunks.push(event.data);
+    recorder.onstop = () => {
+      live.openSegments--;
+      const blob = new Blob(chunks, { type: recorder.mimeType });
+      // Segments are transcribed in order so each is prompted with the text so far
+      live.pending = live.pending.then(() => transcribeSegment(live, blob));
+
+      if (live.stopped && live.openSegments === 0 && live.onFinished) {
+        live.onFinished();
+      }
+    };
+
+    recorder.start();
+    live.recorder = recorder;
+    live.openSegments++;
+    live.segmentStarted = Date.now();
+  };
+
+  // The next segment starts before the current one stops, so no audio is
+  // dropped at the cut
+  const cutSegment = (forced) => {
+    const previous = live.recorder;
+    if (forced) live.forcedCut = true;
+    recordSegment();
+    previous.stop();
+  };
+
+  const samples = new Float32Array(analyser.fftSize);
+  live.poller = setInterval(() => {
+    analyser.getFloatTimeDomainData(samples);
+    let energy = 0;
+    for (const sample of samples) energy += sample * sample;
+    const rms = Math.sqrt(energy / samples.length);
+
+    const now = Date.now();
+    if (rms >= LIVE_SILENCE_RMS) {
+      live.silentSince = null;
+    } else if (live.silentSince === null) {
+      live.silentSince = now;
+    }
+
+    const length = now - live.segmentStarted;
+    const paused =
+      live.silentSince !== null && now - live.silentSince >= LIVE_PAUSE_MS;
+    const cutDue = paused ? LIVE_SEGMENT_MS : LIVE_SEGMENT_MAX_MS;
+    if (length >= cutDue) cutSegment(!paused);
+  }, LIVE_LEVEL_POLL_MS);
+
+  recordSegment();
+}
+
+// Stop segment recording. Resolves with the stitched transcript and the
+// Whisper model(s) that served it once the last segment is transcribed, or
+// null if the full recording should be transcribed instead: live
+// transcription failed, or a segment had to be cut mid-speech and may have
+// split a word.
+function finishLiveTranscription() {
+  const live = liveTranscription;
+  if (!live || !live.recorder) return Promise.resolve(null);
+
+  live.stopped = true;
+  clearInterval(live.poller);
+  live.audioContext.close();
+
+  return new Promise((resolve) => {
+    live.onFinished = () =>
+      live.pending.then(() => {
+        const text = live.texts.join(" ").trim();
+        if (live.failed || live.forcedCut || !text) {
+          resolve(null);
+        } else {
+          resolve({ text, model: [...live.models].join(",") });
+        }
+      });
+
+    if (live.recorder.state !== "inactive") {
+      live.recorder.stop();
+    } else if (live.openSegments === 0) {
+      live.onFinished();
+    }
+  });
+}
+
+// Send one segment to the server and show the transcript so far
+async function transcribeSegment(live, blob) {
+  if (live.failed || blob.size === 0) return;
+
+  const token = localStorage.getItem("token");
+  const formData = new FormData();
+  formData.append("interview_id", currentInterviewId);
+  formData.append("prompt", live.texts.join(" "));
+  formData.append("audio", blob, recordingFileName(blob, "segment"));
+
+  try {
+    const response = await fetch(API_BASE + "/interview/transcribe/chunk", {
+      method: "POST",
+      headers: {
+        Authorization: `Bearer ${token}`,
+      },
+      body: formData,
+    });
+    const data = await response.json();
+
+    if (!response.ok) {
+      console.error("Live transcription error:", data.error);
+      live.failed = true;
+      return;
+    }
+
+    if (data.text) live.texts.push(data.text);
+    if (data.model) live.models.add(data.model);
+    if (liveTranscription === live) showLiveTranscript(live.texts.join(" "));
+  } catch (error) {
+    console.error("Live transcription error:", error);
+    live.failed = true;
+  }
+}
+
+// Show the partial transcript under the recorder
+function showLiveTranscript(text) {
+  const liveTranscript = document.getElementById("liveTranscript");
+  if (!liveTranscript) return;
+
+  liveTranscript.textContent = text;
+  liveTranscript.style.display = text ? "block" : "none";
+}
+
 // Update record button
 function updateRecordButton() {
   const recordBtn = document.getElementById("recordBtn");
@@ -797,7 +1006,22 @@ async function submitAnswer(type) {
         window.currentAudioFile.name,
       );
     } else if (window.currentAudioBlob) {
-      formData.append("audio", window.currentAudioBlob, "answer.wav");
+      // Use the live transcript if every segment was transcribed, otherwise
+      // upload the full recording
+      showLoading(true);
+      const liveTranscript = await window.liveTranscriptPromise;
+      if (liveTranscript) {
+        formData.append("text_answer", liveTranscript.text);
+        if (liveTranscript.model) {
+          formData.append("transcription_model", liveTranscript.model);
+        }
+      } else {
+        formData.append(
+          "audio",
+          window.currentAudioBlob,
+          recordingFileName(window.currentAudioBlob, "answer"),
+        );
+      }
     } else {
       showNotification("Please record or upload your answer first", "error");
       return;
@@ -807,7 +1031,7 @@ async function submitAnswer(type) {
   showLoading(true);
 
   try {
-    const response = await fetch(API_BASE + "/interview/process", {
+    const response = await fetch(API_BASE + "/interview/process/stream", {
       method: "POST",
       headers: {
         Authorization: `Bearer ${token}`,
@@ -815,9 +1039,15 @@ async function submitAnswer(type) {
       body: formData,
     });
 
-    const data = await response.json();
+    if (!response.ok) {
+      const data = await response.json();
+      showNotification(data.error || "Failed to process answer", "error");
+      return;
+    }
 
-    if (response.ok) {
+    const data = await readAnswerStream(response);
+
+    if (data) {
       // Show evaluation
       displayEvaluation(data.evaluation);
 
@@ -826,8 +1056,6 @@ async function submitAnswer(type) {
         currentQuestionIndex++;
         displayQuestion();
       }, 3000);
-    } else {
-      showNotification(data.error || "Failed to process answer", "error");
     }
   } catch (error) {
     console.error("Submit answer error:", error);
@@ -837,6 +1065,52 @@ async function submitAnswer(type) {
   }
 }
 
+// Read the Server-Sent Events stream from /interview/process/stream, showing
+// feedback as it arrives. Resolves with the final evaluation payload.
+async function readAnswerStream(response) {
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  const evaluationDisplay = document.getElementById("evaluationDisplay");
+  let buffer = "";
+  let feedbackText = "";
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+
+    buffer += decoder.decode(value, { stream: true });
+    const messages = buffer.split("\n\n");
+    buffer = messages.pop();
+
+    for (const message of messages) {
+      let event = "message";
+      let data = "";
+      message.split("\n").forEach((line) => {
+        if (line.startsWith("event: ")) event = line.slice(7);
+        else if (line.startsWith("data: ")) data += line.slice(6);
+      });
+      const payload = data ? JSON.parse(data) : {};
+
+      if (event === "feedback") {
+        feedbackText += payload.text;
+        showLoading(false);
+        if (evaluationDisplay) {
+          evaluationDisplay.textContent = feedbackText;
+          evaluationDisplay.style.display = "block";
+        }
+      } else if (event === "evaluation") {
+        return payload;
+      } else if (event === "error") {
+        showNotification(payload.error || "Failed to process answer", "error");
+        return null;
+      }
+    }
+  }
+
+  showNotification("Failed to process answer", "error");
+  return null;
+}
+
 // Display evaluation
 function displayEvaluation(evaluation) {
   const evaluationDisplay = document.getElementById("evaluationDisplay");
@@ -1146,15 +1420,17 @@ document
   .getElementById("start-recording")
   ?.addEventListener("click", async () => {
     try {
-      const stream = await navigator.mediaDevices.getUserMedia({ audio: true });
-      mediaRecorder = new MediaRecorder(stream);
+      const stream = await navigator.mediaDevices.getUserMedia(MICROPHONE_CONSTRAINTS);
+      mediaRecorder = createRecorder(stream);
 
       mediaRecorder.ondataavailable = (event) => {
         audioChunks.push(event.data);
       };
 
       mediaRecorder.onstop = () => {
-        const audioBlob = new Blob(audioChunks, { type: "audio/wav" });
+        const audioBlob = new Blob(audioChunks, {
+          type: mediaRecorder.mimeType,
+        });
         // Process this blob in submitAnswer()
       };
 
@@ -1185,8 +1461,8 @@ document
     formData.append("question", currentQuestion);
 
     if (audioChunks.length > 0) {
-      const audioBlob = new Blob(audioChunks, { type: "audio/wav" });
-      formData.append("audio", audioBlob, "answer.wav");
+      const audioBlob = new Blob(audioChunks, { type: mediaRecorder.mimeType });
+      formData.append("audio", audioBlob, recordingFileName(audioBlob, "answer"));
     } else {
       const textAnswer = document.getElementById("text-answer").value;
       if (!textAnswer) {
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Tests for the Gemini-independent logic of the interview engine
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.ai_engine import (
+    DEFAULT_FOLLOW_UP,
+    FUSED_EVALUATION_SCHEMA,
+    IdealAnswerPrefetcher,
+    InterviewEngine,
+    ideal_answer_cache,
+)
+from services.async_ai_engine import AsyncInterviewEngine
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeAsyncModel:
+    """Stand-in for the Gemini model that answers after a delay"""
+
+    def __init__(self, delay, text="Solid answer with a concrete example."):
+        self.delay = delay
+        self.text = text
+        self.started = 0
+        self.cancelled = 0
+
+    async def generate_content_async(self, prompt):
+        self.started += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return FakeResponse(self.text)
+
+
+def async_engine(model, timeout=None):
+    """AsyncInterviewEngine around a private engine that uses the fake model"""
+    engine = InterviewEngine()
+    engine.model = model
+    return AsyncInterviewEngine(engine=engine, timeout=timeout)
+
+
+def fused_evaluation(**overrides):
+    """A valid fused evaluation payload, with fields overridden as needed"""
+    data = {
+        "ideal_answer": "Profile first, then optimize the hot path.",
+        "score": 72,
+        "feedback": "Clear and structured answer.",
+        "strengths": ["Structured", "Concrete example"],
+        "improvements": ["Quantify the impact"],
+        "suggestions": ["Mention the profiler you used"],
+        "follow_up": "How did you measure the improvement?",
+    }
+    data.update(overrides)
+    return data
+
+
+class SlowIdealAnswerEngine:
+    """Engine stand-in whose ideal answers take a while to generate"""
+
+    language = "en"
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.calls = 0
+
+    def get_ideal_answer(self, question):
+        self.calls += 1
+        time.sleep(self.delay)
+        return f"Ideal answer to: {question}"
+
+
+def test_prefetch_in_progress_is_awaited():
+    """A prefetch that is still running is waited on, not generated twice"""
+    print("🔧 Testing ideal-answer prefetch wait...")
+
+    engine = SlowIdealAnswerEngine(delay=0.3)
+    prefetcher = IdealAnswerPrefetcher()
+    question = "Describe a time you untangled a flaky test suite"
+    prefetcher.prefetch("interview-1", [question], engine)
+
+    answer = prefetcher.get("interview-1", question, engine, timeout=5)
+    assert answer == f"Ideal answer to: {question}", "Prefetched answer expected"
+    assert engine.calls == 1, "The ideal answer should be generated once"
+
+    stats = prefetcher.stats()
+    assert stats["used"] == 1 and stats["waited"] == 1
+    assert stats["not_ready"] == 0
+
+    print("✅ Running prefetches are awaited!")
+
+
+def test_fused_evaluation_validation():
+    """Schema violations in fused evaluations are reported"""
+    print("🔧 Testing fused evaluation validation...")
+
+    engine = InterviewEngine()
+    validate = engine._validate_fused_evaluation
+
+    assert validate(fused_evaluation()) is None, "Valid payload rejected"
+    assert validate(fused_evaluation(score=0)) is None
+    assert validate(fused_evaluation(score=99.5)) is None
+    assert validate(["not", "an", "object"]) == "response is not a JSON object"
+
+    for field in FUSED_EVALUATION_SCHEMA["required"]:
+        data = fused_evaluation()
+        del data[field]
+        assert validate(data) == f"missing field '{field}'"
+
+    wrong_types = {
+        "score": "72",
+        "feedback": 5,
+        "strengths": "Structured",
+        "follow_up": None,
+    }
+    for field, value in wrong_types.items():
+        error = validate(fused_evaluation(**{field: value}))
+        assert error and error.startswith(f"field '{field}' must be of type"), error
+    assert validate(fused_evaluation(score=True)) is not None, "bool is not a number"
+
+    assert validate(fused_evaluation(score=101)) == "field 'score' is out of range"
+    assert validate(fused_evaluation(score=-1)) == "field 'score' is out of range"
+
+    error = validate(fused_evaluation(improvements=["Quantify", 3]))
+    assert error == "field 'improvements' must contain only strings", error
+    error = validate(fused_evaluation(suggestions=[{"text": "Profile"}]))
+    assert error == "field 'suggestions' must contain only strings", error
+
+    assert validate(fused_evaluation(feedback="   ")) == "field 'feedback' is empty"
+
+    # Without the ideal answer the field is no longer required
+    data = fused_evaluation()
+    del data["ideal_answer"]
+    assert validate(data, engine._fused_schema(include_ideal=False)) is None
+
+    print("✅ Fused evaluation validation works!")
+
+
+def test_fused_result_parsing():
+    """Fused responses are parsed from code fences and rejected when invalid"""
+    print("🔧 Testing fused result parsing...")
+
+    engine = InterviewEngine()
+    schema = engine._fused_schema(include_ideal=False)
+    data = fused_evaluation()
+    del data["ideal_answer"]
+    fenced = f"```json\n{json.dumps(data, indent=2)}\n```"
+
+    evaluation, follow_up = engine._build_fused_result(
+        "How do you speed up slow code?",
+        "I profile first and then optimize the hot path.",
+        "Profile first, then optimize the hot path.",
+        schema,
+        fenced,
+    )
+    assert follow_up == data["follow_up"]
+    assert evaluation["feedback"] == data["feedback"]
+    assert evaluation["strengths"] == data["strengths"]
+    assert 0 <= evaluation["score"] <= 100
+
+    # The generated ideal answer is used when none was passed in
+    enabled, ideal_answer_cache.enabled = ideal_answer_cache.enabled, False
+    try:
+        evaluation, _ = engine._build_fused_result(
+            "How do you speed up slow code?",
+            "I profile first.",
+            None,
+            FUSED_EVALUATION_SCHEMA,
+            f"```\n{json.dumps(fused_evaluation())}\n```",
+        )
+    finally:
+        ideal_answer_cache.enabled = enabled
+    assert evaluation["ideal_answer"] == fused_evaluation()["ideal_answer"]
+
+    invalid = json.dumps(fused_evaluation(score=150, strengths="Structured"))
+    for text in (invalid, "```json\n{not json}\n```"):
+        try:
+            engine._build_fused_result("Q", "A", "Ideal", FUSED_EVALUATION_SCHEMA, text)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"Invalid fused response accepted: {text}")
+
+    print("✅ Fused result parsing works!")
+
+
+def test_async_deadline_falls_back():
+    """Calls that miss their deadline are cancelled and fall back"""
+    print("🔧 Testing async engine deadlines...")
+
+    question = "How do you speed up slow code?"
+    answer = "I profile first and then optimize the hot path."
+    ideal = "Profile first, then optimize the hot path."
+
+    model = FakeAsyncModel(delay=0.01)
+    evaluation = asyncio.run(
+        async_engine(model).evaluate_answer(question, answer, ideal)
+    )
+    assert evaluation["feedback"] == model.text, "Fast model should be used"
+
+    model = FakeAsyncModel(delay=5)
+    engine = async_engine(model, timeout=0.05)
+
+    async def evaluate():
+        return await asyncio.gather(
+            engine.evaluate_answer(question, answer, ideal),
+            engine.generate_follow_up(question, answer),
+        )
+
+    start = time.time()
+    evaluation, follow_up = asyncio.run(evaluate())
+    assert time.time() - start < 2, "Deadline was not enforced"
+    assert evaluation == engine.engine._fallback_evaluation(answer)
+    assert follow_up == DEFAULT_FOLLOW_UP
+    assert model.started == 2 and model.cancelled == 2, "Slow calls not cancelled"
+
+    print("✅ Async deadlines fall back!")
+
+
+def test_async_cancellation_propagates():
+    """Cancelling the caller cancels the Gemini request instead of falling back"""
+    print("🔧 Testing async engine cancellation...")
+
+    model = FakeAsyncModel(delay=5)
+    engine = async_engine(model, timeout=10)
+
+    async def cancel_evaluation():
+        task = asyncio.create_task(
+            engine.evaluate_answer("Question", "Answer", "Ideal answer")
+        )
+        await asyncio.sleep(0.05)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            return True
+        return False
+
+    assert asyncio.run(cancel_evaluation()), "Cancellation was swallowed"
+    assert model.started == 1 and model.cancelled == 1, "Request not cancelled"
+
+    print("✅ Async cancellation propagates!")
+
+
+def main():
+    """Run all interview engine tests"""
+    print("🤖 AI Interview CRM - Interview Engine Tests")
+    print("=" * 45)
+
+    try:
+        test_fused_evaluation_validation()
+        test_fused_result_parsing()
+        test_prefetch_in_progress_is_awaited()
+        test_async_deadline_falls_back()
+        test_async_cancellation_propagates()
+        print("\n🎉 All interview engine tests passed!")
+        return True
+    except AssertionError as e:
+        print(f"❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Tests for background answer jobs and their status stream
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import jwt
+from flask import Flask
+
+from config import Config
+from models.answer_job import AnswerJob
+from models.db import db, init_db
+from models.interview import Interview
+from models.user import User
+from routes.interview import interview_bp
+from services.answer_jobs import AnswerJobError, AnswerJobRunner
+
+
+def make_app(db_path):
+    """Minimal app with the interview routes on a throwaway SQLite database"""
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{db_path}"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    init_db(app)
+    app.register_blueprint(interview_bp, url_prefix="/api/interview")
+    return app
+
+
+def make_job(user_id=None, interview_id=None):
+    """Create a user, interview and queued job, returning the job"""
+    if user_id is None:
+        user = User(email=f"{time.time_ns()}@example.com", password_hash="x")
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+    if interview_id is None:
+        interview = Interview(user_id=user_id)
+        db.session.add(interview)
+        db.session.commit()
+        interview_id = interview.id
+
+    job = AnswerJob(user_id=user_id, interview_id=interview_id)
+    db.session.add(job)
+    db.session.commit()
+    return job
+
+
+def wait_until_finished(job_id, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        db.session.expire_all()
+        job = AnswerJob.query.get(job_id)
+        if job.finished:
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+def run_with_app(test):
+    """Run test(app) against a fresh database, removing it afterwards"""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        app = make_app(os.path.join(temp_dir, "jobs.db"))
+        with app.app_context():
+            test(app)
+            db.session.remove()
+            db.engine.dispose()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_runner_marks_jobs_done_and_failed():
+    """Jobs end DONE with their result, or FAILED with a safe message"""
+    print("🧪 Testing answer job runner...")
+
+    def check(app):
+        runner = AnswerJobRunner(max_workers=1)
+
+        def succeed(job, value):
+            job.set_status(AnswerJob.EVALUATING)
+            return {"value": value}
+
+        def reject(job):
+            raise AnswerJobError("Answer is too long.")
+
+        def crash(job):
+            raise RuntimeError("database password in traceback")
+
+        done = make_job()
+        rejected = make_job(done.user_id, done.interview_id)
+        crashed = make_job(done.user_id, done.interview_id)
+        runner.submit(app, done.id, succeed, 42)
+        runner.submit(app, rejected.id, reject)
+        runner.submit(app, crashed.id, crash)
+
+        job = wait_until_finished(done.id)
+        assert job.status == AnswerJob.DONE and job.result == {"value": 42}
+
+        job = wait_until_finished(rejected.id)
+        assert job.status == AnswerJob.FAILED
+        assert job.error == "Answer is too long.", "AnswerJobError text is shown"
+
+        job = wait_until_finished(crashed.id)
+        assert job.status == AnswerJob.FAILED
+        assert "password" not in job.error, "Internal errors are not shown"
+
+        runner._executor.shutdown(wait=True)
+        stats = runner.stats()
+        assert stats["submitted"] == 3 and stats["failed"] == 2
+        assert stats["queued"] == 0 and stats["running"] == 0
+
+    run_with_app(check)
+    print("✅ Answer job runner works!")
+
+
+def test_stale_and_purged_jobs():
+    """Stale jobs are failed and old finished jobs are purged"""
+    print("🧪 Testing answer job expiry...")
+
+    def check(app):
+        old = datetime.utcnow() - timedelta(seconds=120)
+
+        stale = make_job()
+        fresh = make_job(stale.user_id, stale.interview_id)
+        stale.updated_at = old
+        db.session.commit()
+
+        stale.fail_if_stale(60)
+        fresh.fail_if_stale(60)
+        assert stale.status == AnswerJob.FAILED
+        assert stale.error == "Answer processing timed out"
+        assert fresh.status == AnswerJob.QUEUED, "Fresh jobs are left running"
+
+        finished = make_job(stale.user_id, stale.interview_id)
+        finished.set_status(AnswerJob.DONE, result={})
+        running = make_job(stale.user_id, stale.interview_id)
+        for job in (stale, running):
+            job.updated_at = old
+        db.session.commit()
+        stale_id, fresh_id = stale.id, fresh.id
+        finished_id, running_id = finished.id, running.id
+
+        AnswerJob.purge_finished(60)
+        db.session.expire_all()
+        assert AnswerJob.query.get(stale_id) is None, "Old finished job kept"
+        assert AnswerJob.query.get(finished_id), "Recent finished job purged"
+        assert AnswerJob.query.get(running_id), "Unfinished job purged"
+        assert AnswerJob.query.get(fresh_id)
+
+    run_with_app(check)
+    print("✅ Answer job expiry works!")
+
+
+def test_job_stream_is_capped():
+    """A job stream closes with a retry hint once it reaches its time limit"""
+    print("🧪 Testing answer job stream limit...")
+
+    def check(app):
+        job = make_job()
+        token = jwt.encode(
+            {"user_id": job.user_id, "exp": datetime.utcnow() + timedelta(hours=1)},
+            Config.SECRET_KEY,
+            algorithm="HS256",
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+        url = f"/api/interview/jobs/{job.id}?stream=true"
+        stream_seconds = Config.ANSWER_JOB_STREAM_SECONDS
+        Config.ANSWER_JOB_STREAM_SECONDS = 1
+        try:
+            started = time.time()
+            body = app.test_client().get(url, headers=headers).get_data(as_text=True)
+        finally:
+            Config.ANSWER_JOB_STREAM_SECONDS = stream_seconds
+
+        assert time.time() - started < 5, "Stream was not cut off"
+        assert body.startswith("event: status\n"), body
+        assert body.endswith("retry: 1000\n\n"), "Missing reconnect hint"
+
+        job.set_status(AnswerJob.DONE, result={"evaluation": {"score": 80}})
+        body = app.test_client().get(url, headers=headers).get_data(as_text=True)
+        assert "event: evaluation" in body and "retry:" not in body
+
+    run_with_app(check)
+    print("✅ Answer job streams are capped!")
+
+
+def main():
+    """Run all answer job tests"""
+    print("🤖 AI Interview CRM - Answer Job Tests")
+    print("=" * 40)
+
+    try:
+        test_runner_marks_jobs_done_and_failed()
+        test_stale_and_purged_jobs()
+        test_job_stream_is_capped()
+        print("\n🎉 All answer job tests passed!")
+        return True
+    except AssertionError as e:
+        print(f"❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Tests for audio preprocessing ahead of Whisper transcription
+"""
+
+import io
+import os
+import sys
+import threading
+import time
+import numpy as np
+import soundfile as sf
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import Config
+from services.transcription_backends import TranscriptionBackend
+from services.voice_processor import (
+    NO_SPEECH,
+    SAMPLE_RATE,
+    AdmissionLimiter,
+    ModelTierPolicy,
+    decode_options,
+    detect_container,
+    resample,
+    TranscriptionBusy,
+    VoiceProcessor,
+    trim_silence,
+)
+
+
+def tone(frequency, samplerate, seconds=1.0):
+    t = np.arange(int(samplerate * seconds)) / samplerate
+    return np.sin(2 * np.pi * frequency * t).astype(np.float32)
+
+
+def rms(samples):
+    return float(np.sqrt(np.mean(np.square(samples))))
+
+
+def test_resample_output_length():
+    """Resampled audio keeps its duration for common browser sample rates"""
+    print("🔧 Testing resampled output length...")
+
+    for samplerate in (8000, 22050, 44100, 48000):
+        samples = np.zeros(samplerate * 3, dtype=np.float32)
+        output = resample(samples, samplerate, SAMPLE_RATE)
+        assert len(output) == SAMPLE_RATE * 3, f"Wrong length for {samplerate} Hz"
+        assert output.dtype == np.float32, "Output should stay float32"
+
+    samples = np.ones(100, dtype=np.float32)
+    assert resample(samples, SAMPLE_RATE, SAMPLE_RATE) is samples
+
+    print("✅ Resampled output length is correct!")
+
+
+def test_resample_filters_aliasing():
+    """Speech-band content passes while content above 8 kHz is removed"""
+    print("🔧 Testing resampler anti-aliasing...")
+
+    speech = resample(tone(1000, 44100), 44100, SAMPLE_RATE)
+    assert abs(rms(speech[1000:-1000]) - rms(tone(1000, 44100))) < 0.01
+
+    # A 12 kHz tone would fold back to 4 kHz with plain decimation
+    aliased = resample(tone(12000, 44100), 44100, SAMPLE_RATE)
+    assert rms(aliased) < 0.01, "Content above Nyquist should be filtered"
+
+    print("✅ Resampler removes aliasing!")
+
+
+def test_trim_silence():
+    """Edge silence is removed and long pauses are shortened"""
+    print("🔧 Testing silence trimming...")
+
+    rng = np.random.default_rng(0)
+
+    def noise(seconds):
+        return 0.002 * rng.standard_normal(int(SAMPLE_RATE * seconds))
+
+    speech = 0.3 * tone(200, SAMPLE_RATE, seconds=1.0)
+    samples = np.concatenate(
+        [noise(3), speech, noise(4), speech, noise(0.3), speech, noise(5)]
+    ).astype(np.float32)
+
+    trimmed, removed = trim_silence(samples, max_pause=0.6, padding=0.2)
+    duration = len(trimmed) / SAMPLE_RATE
+
+    assert abs(len(samples) / SAMPLE_RATE - duration - removed) < 1e-6
+    # 3s of speech, a 0.3s pause, the 4s pause cut to 0.6s, plus 0.2s padding
+    # around each speech region
+    assert 4.4 <= duration <= 5.0, f"Unexpected trimmed duration {duration:.2f}s"
+    assert trimmed.dtype == np.float32
+
+    silent, removed = trim_silence(np.zeros(SAMPLE_RATE, dtype=np.float32))
+    assert len(silent) == 0 and removed == 1.0, "Digital silence should be removed"
+
+    print("✅ Silence trimming works!")
+
+
+def test_model_tier_policy():
+    """Tiers step down under load and back up when load drops"""
+    print("🔧 Testing adaptive model tier policy...")
+
+    policy = ModelTierPolicy(
+        ["tiny", "base", "small"],
+        "base",
+        queue_threshold=2,
+        rtf_threshold=0.5,
+        cooldown=0,
+    )
+    assert policy.tiers == ["tiny", "base"], "Tiers above the preferred are unused"
+    assert policy.select(queue_depth=0) == "base"
+
+    assert policy.select(queue_depth=3) == "tiny", "Deep queue should step down"
+    assert policy.select(queue_depth=3) == "tiny", "Already at the fastest tier"
+
+    policy.record(4.0, 30.0)
+    assert policy.select(queue_depth=0) == "base", "Idle load should step up"
+
+    # Long answers take longer without the model falling behind
+    for _ in range(5):
+        policy.record(20.0, 120.0)
+    assert policy.select(queue_depth=0) == "base", "Long clips are not load"
+
+    # Short clips still cost a full 30 s window
+    for _ in range(5):
+        policy.record(3.0, 2.0)
+    assert policy.select(queue_depth=0) == "base", "Short clips are not load"
+
+    for _ in range(20):
+        policy.record(40.0, 60.0)
+    assert policy.select(queue_depth=0) == "tiny", "High p95 RTF should step down"
+
+    fixed = ModelTierPolicy(["tiny", "base"], "base", adaptive=False, cooldown=0)
+    assert fixed.select(queue_depth=10) == "base", "Non-adaptive policy is fixed"
+
+    assert decode_options("tiny")["temperature"] == 0.0
+    assert decode_options("small.en")["beam_size"] == 5
+    assert decode_options("base", "cuda")["fp16"] is True
+    assert decode_options("base")["fp16"] is False
+
+    print("✅ Adaptive model tier policy works!")
+
+
+def test_detect_container():
+    """Test container sniffing that routes browser recordings to ffmpeg"""
+    print("🧪 Testing container detection...")
+
+    wav = io.BytesIO()
+    sf.write(wav, tone(440, SAMPLE_RATE, 0.1), SAMPLE_RATE, format="WAV")
+    assert detect_container(wav.getvalue()[:16]) == "wav"
+
+    assert detect_container(b"\x1a\x45\xdf\xa3\x9f\x42\x86\x81") == "webm"
+    assert detect_container(b"OggS\x00\x02") == "ogg"
+    assert detect_container(b"\x00\x00\x00\x1cftypM4A ") == "mp4"
+    assert detect_container(b"ID3\x04\x00") == "mp3"
+    assert detect_container(b"not audio at all") is None
+
+    print("✅ Container detection works!")
+
+
+def test_admission_limiter():
+    """Test that transcriptions beyond the slots and queue are turned away"""
+    print("🧪 Testing transcription admission control...")
+
+    limiter = AdmissionLimiter(max_concurrent=1, max_queued=1, timeout=5)
+    running, release = threading.Event(), threading.Event()
+
+    def hold_slot():
+        with limiter.slot():
+            running.set()
+            release.wait()
+
+    holder = threading.Thread(target=hold_slot)
+    holder.start()
+    running.wait()
+    waiter = threading.Thread(target=hold_slot)
+    waiter.start()
+    while limiter.stats()["queued"] < 1:
+        time.sleep(0.01)
+
+    try:
+        with limiter.slot():
+            assert False, "Third caller should be rejected"
+    except TranscriptionBusy as e:
+        assert e.retry_after >= 1
+
+    release.set()
+    holder.join()
+    waiter.join()
+
+    stats = limiter.stats()
+    assert stats["in_flight"] == 0 and stats["queued"] == 0
+    assert stats["rejected"] == 1
+
+    # A caller that waits out the timeout is rejected too
+    limiter = AdmissionLimiter(max_concurrent=1, max_queued=1, timeout=0.05)
+    with limiter.slot():
+        try:
+            with limiter.slot():
+                assert False, "Timed-out caller should be rejected"
+        except TranscriptionBusy:
+            pass
+    assert limiter.stats()["rejected"] == 1
+
+    print("✅ Admission control works!")
+
+
+class FakeBackend(TranscriptionBackend):
+    """Backend that returns a fixed transcript without loading Whisper"""
+
+    name = "fake"
+
+    def __init__(self, text):
+        super().__init__()
+        self.text = text
+        self.calls = 0
+
+    def load(self, model_name):
+        return object()
+
+    def transcribe(self, model, samples, language=None, prompt=None, options=None):
+        self.calls += 1
+        return self.text
+
+
+def fake_processor(text, cache=False):
+    """Processor on a fake backend, with an in-memory transcript cache if asked"""
+    cache_enabled = Config.TRANSCRIPT_CACHE_ENABLED
+    cache_persist = Config.TRANSCRIPT_CACHE_PERSIST
+    Config.TRANSCRIPT_CACHE_ENABLED = cache
+    Config.TRANSCRIPT_CACHE_PERSIST = False
+    try:
+        return VoiceProcessor(use_server=False, backend=FakeBackend(text))
+    finally:
+        Config.TRANSCRIPT_CACHE_ENABLED = cache_enabled
+        Config.TRANSCRIPT_CACHE_PERSIST = cache_persist
+
+
+def wav_bytes(samples):
+    buffer = io.BytesIO()
+    sf.write(buffer, samples, SAMPLE_RATE, format="WAV")
+    return buffer.getvalue()
+
+
+def test_transcription_failures_are_flagged():
+    """Test that failures are flagged explicitly, not guessed from the text"""
+    print("🧪 Testing transcription failure reporting...")
+
+    speech = wav_bytes(tone(220, SAMPLE_RATE, 2.0) * 0.5)
+
+    # Answers may start with words that look like error messages
+    result = fake_processor("Error handling is important to me").transcribe(speech)
+    assert result["text"] == "Error handling is important to me"
+    assert "failure" not in result, "A real transcript is not a failure"
+    assert result["model"]
+
+    result = fake_processor("").transcribe(speech)
+    assert result["failure"] == NO_SPEECH
+
+    result = fake_processor("unused").transcribe(b"not audio")
+    assert result["failure"] and result["model"] is None
+
+    print("✅ Transcription failures are reported explicitly!")
+
+
+def test_transcript_cache_uses_serving_model():
+    """Transcripts are cached under the model that produced them"""
+    print("🧪 Testing transcript cache keys...")
+
+    speech = wav_bytes(tone(220, SAMPLE_RATE, 2.0) * 0.5)
+    processor = fake_processor("I led the migration", cache=True)
+    policy = processor.tier_policy
+    preferred = processor.model_name(policy.current, "en")
+
+    # A clip served by a stepped-down tier is not reused at the preferred tier
+    policy.select = lambda queue_depth: policy.tiers[0]
+    degraded = processor.transcribe(speech, language="en")
+    del policy.select
+    assert degraded["model"] == processor.model_name(policy.tiers[0], "en")
+    assert degraded["model"] != preferred
+
+    result = processor.transcribe(speech, language="en")
+    assert result["model"] == preferred, "Degraded transcript served from cache"
+    assert processor.backend.calls == 2
+
+    result = processor.transcribe(speech, language="en")
+    assert result["model"] == preferred
+    assert processor.backend.calls == 2, "Preferred transcript should be cached"
+
+    print("✅ Transcript cache keys name the serving model!")
+
+
+def main():
+    """Run all audio processing tests"""
+    print("🎙️ AI Interview CRM - Audio Processing Tests")
+    print("=" * 45)
+
+    try:
+        test_resample_output_length()
+        test_resample_filters_aliasing()
+        test_trim_silence()
+        test_model_tier_policy()
+        test_detect_container()
+        test_admission_limiter()
+        test_transcription_failures_are_flagged()
+        test_transcript_cache_uses_serving_model()
+        print("\n🎉 All audio processing tests passed!")
+        return True
+    except AssertionError as e:
+        print(f"❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-memory LRU and persistent SQLite caches
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.cache import LRUCache, SQLiteCache
+
+
+def test_lru_eviction_order():
+    """Least recently used entries are evicted first"""
+    print("🔧 Testing LRU eviction order...")
+
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1, "Cached value should be returned"
+
+    # "b" is now least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None, "LRU entry should be evicted"
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+    stats = cache.stats()
+    assert stats["evictions"] == 1, "One eviction should be counted"
+    assert stats["hits"] == 3 and stats["misses"] == 1
+
+    print("✅ LRU eviction order is correct!")
+
+
+def test_lru_ttl_expiry():
+    """Entries are not returned after their TTL"""
+    print("🔧 Testing LRU TTL expiry...")
+
+    cache = LRUCache(maxsize=10, ttl=0.05)
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+
+    time.sleep(0.1)
+    assert cache.get("key") is None, "Expired entry should be a miss"
+    assert len(cache) == 0, "Expired entry should be removed"
+
+    print("✅ LRU TTL expiry works!")
+
+
+def test_sqlite_cache_persistence():
+    """Values persist across cache instances sharing a database file"""
+    print("🔧 Testing SQLite cache persistence...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache.db")
+
+        SQLiteCache(path, "answers").set("q1", {"text": "answer", "items": [1, 2]})
+        reopened = SQLiteCache(path, "answers")
+        assert reopened.get("q1") == {"text": "answer", "items": [1, 2]}
+        assert reopened.get("missing") is None
+
+    print("✅ SQLite cache persistence works!")
+
+
+def test_sqlite_cache_trim():
+    """Expired and excess rows are trimmed on write"""
+    print("🔧 Testing SQLite cache trimming...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SQLiteCache(os.path.join(tmp, "cache.db"), "answers", max_rows=5)
+        for i in range(SQLiteCache.TRIM_INTERVAL):
+            cache.set(f"key{i}", i)
+
+        assert cache.count() == 5, "Table should be trimmed to max_rows"
+        assert cache.get(f"key{SQLiteCache.TRIM_INTERVAL - 1}") is not None
+        assert cache.get("key0") is None, "Oldest rows should be removed"
+
+        expiring = SQLiteCache(os.path.join(tmp, "cache.db"), "expiring", ttl=0.05)
+        expiring.set("key", "value")
+        time.sleep(0.1)
+        assert expiring.get("key") is None, "Expired row should be a miss"
+
+    print("✅ SQLite cache trimming works!")
+
+
+def main():
+    """Run all cache tests"""
+    print("🗃️ AI Interview CRM - Cache Tests")
+    print("=" * 40)
+
+    try:
+        test_lru_eviction_order()
+        test_lru_ttl_expiry()
+        test_sqlite_cache_persistence()
+        test_sqlite_cache_trim()
+        print("\n🎉 All cache tests passed!")
+        return True
+    except AssertionError as e:
+        print(f"❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for PDF text extraction budgets and parallel page extraction
+"""
+
+import io
+import os
+import sys
+import tempfile
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fpdf import FPDF
+
+from config import Config
+from services import pdf_parser
+from services.pdf_parser import PDFParser
+
+
+def make_pdf(page_count):
+    """Build an in-memory PDF whose pages carry distinct, numbered text"""
+    pdf = FPDF()
+    pdf.set_font("Helvetica", size=11)
+    for page_num in range(page_count):
+        pdf.add_page()
+        pdf.multi_cell(0, 8, f"Page {page_num + 1}. " + "Resume line text. " * 30)
+    return bytes(pdf.output())
+
+
+class PDFSettings:
+    """Temporarily override the Config.PDF_* settings"""
+
+    def __init__(self, **settings):
+        self.settings = settings
+        self.saved = {}
+
+    def __enter__(self):
+        for name, value in self.settings.items():
+            self.saved[name] = getattr(Config, name)
+            setattr(Config, name, value)
+
+    def __exit__(self, *exc):
+        for name, value in self.saved.items():
+            setattr(Config, name, value)
+
+
+def test_extract_text_stops_at_budget():
+    """Extraction stops once the character or page budget is reached"""
+    print("🔧 Testing PDF extraction budgets...")
+
+    data = make_pdf(10)
+    parser = PDFParser()
+    iter_pages = parser.iter_pages
+    consumed = []
+
+    def counting_iter_pages(pdf):
+        for page_text in iter_pages(pdf):
+            consumed.append(page_text)
+            yield page_text
+
+    parser.iter_pages = counting_iter_pages
+
+    with PDFSettings(PDF_MAX_CHARS=1000, PDF_MAX_PAGES=0, PDF_WORKERS=0):
+        text = parser.extract_text(io.BytesIO(data))
+    assert len(text) == 1000, "Text should be cut to PDF_MAX_CHARS"
+    assert text.startswith("Page 1.")
+    assert 0 < len(consumed) < 10, "Pages past the char budget were extracted"
+
+    consumed.clear()
+    with PDFSettings(PDF_MAX_CHARS=0, PDF_MAX_PAGES=3, PDF_WORKERS=0):
+        text = parser.extract_text(io.BytesIO(data))
+    assert len(consumed) == 3, "Pages past PDF_MAX_PAGES were extracted"
+    assert "Page 3." in text and "Page 4." not in text
+
+    print("✅ PDF extraction budgets work!")
+
+
+def test_parallel_matches_sequential():
+    """Page ranges extracted in the process pool match sequential extraction"""
+    print("🔧 Testing parallel PDF extraction...")
+
+    data = make_pdf(7)
+    parser = PDFParser()
+
+    with PDFSettings(PDF_MAX_CHARS=0, PDF_MAX_PAGES=0, PDF_WORKERS=0):
+        sequential = parser.extract_text(io.BytesIO(data))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "resume.pdf")
+        with open(path, "wb") as f:
+            f.write(data)
+
+        try:
+            with PDFSettings(
+                PDF_MAX_CHARS=0,
+                PDF_MAX_PAGES=0,
+                PDF_WORKERS=2,
+                PDF_PARALLEL_MIN_PAGES=2,
+            ):
+                from_bytes = parser.extract_text(io.BytesIO(data))
+                from_path = parser.extract_text(path)
+            assert pdf_parser._page_pool is not None, "Process pool was not used"
+        finally:
+            if pdf_parser._page_pool is not None:
+                pdf_parser._page_pool.shutdown()
+                pdf_parser._page_pool = None
+
+    assert "Page 7." in sequential
+    assert from_bytes == sequential, "Parallel output differs from sequential"
+    assert from_path == sequential, "Parallel output differs for file paths"
+
+    print("✅ Parallel extraction matches sequential!")
+
+
+def main():
+    """Run all PDF parser tests"""
+    print("🤖 AI Interview CRM - PDF Parser Tests")
+    print("=" * 40)
+
+    try:
+        test_extract_text_stops_at_budget()
+        test_parallel_matches_sequential()
+        print("\n🎉 All PDF parser tests passed!")
+        return True
+    except AssertionError as e:
+        print(f"❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)